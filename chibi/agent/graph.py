@@ -2,15 +2,17 @@
 
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from langgraph.graph import END, StateGraph
 
+from ..constants import DISCORD_CHUNK_SIZE, DISCORD_MESSAGE_LIMIT, NO_MENTIONS
 from .memory import ConversationMemory
 from .state import AgentState, SubAgentState, ToolResult
 
 if TYPE_CHECKING:
     from ..llm.manager import LLMManager
+    from ..services.response_cache import ResponseCache
     from ..tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
@@ -96,6 +98,7 @@ class MainAgent:
         tool_registry: "ToolRegistry",
         conversation_memory: ConversationMemory,
         course: Any = None,
+        response_cache: Optional["ResponseCache"] = None,
     ):
         """Initialize the main agent.
 
@@ -104,11 +107,15 @@ class MainAgent:
             tool_registry: Registry of available tools
             conversation_memory: Conversation memory manager
             course: Course object with modules
+            response_cache: Optional semantic cache for course Q&A replies
         """
         self.llm_manager = llm_manager
         self.tool_registry = tool_registry
         self.conversation_memory = conversation_memory
         self.course = course
+        self.response_cache = response_cache
+        # (course, prompt) for the last built system prompt
+        self._system_prompt_cache: Optional[Tuple[Any, str]] = None
         self.graph = self._build_graph()
         logger.info("Main ReAct agent initialized")
 
@@ -143,7 +150,15 @@ class MainAgent:
         return graph.compile()
 
     def _build_system_prompt(self) -> str:
-        """Build system prompt with module list."""
+        """Build system prompt with module list.
+
+        The prompt depends only on the course, so it is built once per course
+        instead of on every reasoning step.
+        """
+        cached = self._system_prompt_cache
+        if cached is not None and cached[0] is self.course:
+            return cached[1]
+
         module_list = ""
         if self.course and hasattr(self.course, "modules"):
             modules = [
@@ -153,7 +168,9 @@ class MainAgent:
             if modules:
                 module_list = "Available course modules:\n" + "\n".join(modules)
 
-        return SYSTEM_PROMPT.format(module_list=module_list)
+        system_prompt = SYSTEM_PROMPT.format(module_list=module_list)
+        self._system_prompt_cache = (self.course, system_prompt)
+        return system_prompt
 
     async def _reason_node(self, state: AgentState) -> Dict[str, Any]:
         """Reasoning node - LLM decides what to do next.
@@ -452,15 +469,81 @@ class MainAgent:
         if not response:
             return
 
-        if len(response) > 2000:
-            chunks = [response[i : i + 2000] for i in range(0, len(response), 2000)]
-            for i, chunk in enumerate(chunks):
-                if i == 0:
-                    await message.reply(chunk, mention_author=False)
-                else:
-                    await message.channel.send(chunk)
-        else:
-            await message.reply(response, mention_author=False)
+        if len(response) <= DISCORD_MESSAGE_LIMIT:
+            await message.reply(
+                response, mention_author=False, allowed_mentions=NO_MENTIONS
+            )
+            return
+
+        # Reply with the first chunk, then continue in the channel
+        await message.reply(
+            response[:DISCORD_CHUNK_SIZE],
+            mention_author=False,
+            allowed_mentions=NO_MENTIONS,
+        )
+        for start in range(DISCORD_CHUNK_SIZE, len(response), DISCORD_CHUNK_SIZE):
+            await message.channel.send(
+                response[start : start + DISCORD_CHUNK_SIZE],
+                allowed_mentions=NO_MENTIONS,
+            )
+
+    def _is_cacheable_turn(self, state: Dict[str, Any]) -> bool:
+        """Check whether a finished turn's reply can be reused for other users.
+
+        Only course-content answers are cached: every tool call in the turn
+        must have been a content search, and no tool may have replied itself.
+        Quiz, status, and guidance results are per-user and never cached.
+
+        Args:
+            state: Final state after graph execution
+
+        Returns:
+            True if the final response is safe to cache
+        """
+        tool_results = state.get("tool_results") or []
+        if not tool_results or not state.get("final_response"):
+            return False
+        return all(
+            result.success
+            and result.metadata.get("chunk_ids")
+            and not result.metadata.get("response_sent")
+            for result in tool_results
+        )
+
+    async def _respond_from_cache(
+        self, state: AgentState, reply: str
+    ) -> Dict[str, Any]:
+        """Send a cached reply and record the exchange in conversation memory.
+
+        Args:
+            state: Initial agent state for this message
+            reply: Cached reply text
+
+        Returns:
+            State reflecting the sent response
+        """
+        try:
+            await self._send_response(state["discord_message"], reply)
+        except Exception as e:
+            logger.error(f"Error sending cached response: {e}", exc_info=True)
+
+        user_id = state.get("user_id", "")
+        channel_id = state.get("channel_id", "")
+        if user_id and channel_id:
+            self.conversation_memory.add_message(
+                user_id=user_id,
+                channel_id=channel_id,
+                role="user",
+                content=state.get("user_message", ""),
+            )
+            self.conversation_memory.add_message(
+                user_id=user_id,
+                channel_id=channel_id,
+                role="assistant",
+                content=reply,
+            )
+
+        return {**state, "final_response": reply, "response_sent": True}
 
     async def invoke(
         self,
@@ -495,7 +578,27 @@ class MainAgent:
         }
 
         try:
+            # Serve repeated course questions from the semantic cache. Only
+            # opening messages qualify; follow-ups depend on this user's history.
+            embedding = None
+            has_history = bool(
+                self.conversation_memory.get_history(
+                    initial_state["user_id"], initial_state["channel_id"], limit=1
+                )
+            )
+            if self.response_cache and self.response_cache.is_cacheable(
+                content, has_history=has_history
+            ):
+                embedding = await self.response_cache.embed(content)
+                cached_reply = self.response_cache.lookup(content, embedding)
+                if cached_reply:
+                    return await self._respond_from_cache(initial_state, cached_reply)
+
             final_state = await self.graph.ainvoke(initial_state)
+            if embedding is not None and self._is_cacheable_turn(final_state):
+                self.response_cache.store(
+                    content, embedding, self._clean_response(final_state["final_response"])
+                )
             return final_state
         except Exception as e:
             logger.error(f"Error invoking agent: {e}", exc_info=True)
@@ -514,6 +617,7 @@ def create_agent(
     tool_registry: "ToolRegistry",
     conversation_memory: ConversationMemory,
     course: Any = None,
+    response_cache: Optional["ResponseCache"] = None,
 ) -> MainAgent:
     """Create and configure a MainAgent instance.
 
@@ -522,6 +626,7 @@ def create_agent(
         tool_registry: Registry of available tools
         conversation_memory: Conversation memory manager
         course: Course object with modules
+        response_cache: Optional semantic cache for course Q&A replies
 
     Returns:
         Configured MainAgent instance
@@ -531,4 +636,5 @@ def create_agent(
         tool_registry=tool_registry,
         conversation_memory=conversation_memory,
         course=course,
+        response_cache=response_cache,
     )
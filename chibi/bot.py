@@ -1,7 +1,8 @@
 """Main Discord bot class for Chibi."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 import discord
 from discord import app_commands
@@ -11,7 +12,14 @@ from .agent.graph import MainAgent, create_agent
 from .agent.memory import ConversationMemory
 from .agent.context_manager import ContextManagerAgent, create_context_manager
 from .config import Config, load_config
+from .constants import (
+    DISCORD_ERROR_RESPONSE_TIMEOUT,
+    ERROR_GENERIC,
+    NL_MESSAGE_TOO_SHORT,
+    NL_MIN_MESSAGE_LENGTH,
+)
 from .content.course import Course, load_course
+from .cogs.utils import AdminChannelCheckFailure
 from .content.loader import ContentLoader
 from .database.connection import Database
 from .database.repositories import (
@@ -37,6 +45,7 @@ from .services import (
     LLMQuizChallengeService,
     QuizService,
     RAGService,
+    ResponseCache,
     SearchAgentService,
     SimilarityService,
 )
@@ -60,6 +69,8 @@ class ChibiBot(commands.Bot):
         )
 
         self.config = config
+        # Read by the admin_channel_only check on every prefix command
+        self.admin_channel_id: Optional[int] = config.discord.admin_channel_id
         self.course: Optional[Course] = None
         self.llm_manager: Optional[LLMManager] = None
         self.database: Optional[Database] = None
@@ -90,6 +101,11 @@ class ChibiBot(commands.Bot):
         self.conversation_memory: Optional[ConversationMemory] = None
         self.context_manager: Optional[ContextManagerAgent] = None
         self.search_agent: Optional[SearchAgentService] = None
+        self._nl_semaphore: Optional[asyncio.Semaphore] = None
+        # (name, resource) pairs with an async close(), in setup order
+        self._resources: List[Tuple[str, Any]] = []
+        # Set for O(1) membership checks in on_message
+        self._nl_channels = frozenset(config.agent.nl_routing_channels)
 
     def log_to_conversation(
         self,
@@ -127,6 +143,7 @@ class ChibiBot(commands.Bot):
         # Initialize database and repositories
         self.database = Database(self.config.database.path)
         await self.database.connect()
+        self._resources.append(("Database", self.database))
         self.user_repo = UserRepository(self.database)
         self.quiz_repo = QuizRepository(self.database)
         self.mastery_repo = MasteryRepository(self.database)
@@ -137,11 +154,13 @@ class ChibiBot(commands.Bot):
         # Initialize similarity repository (ChromaDB)
         self.similarity_repo = SimilarityRepository(self.config.similarity)
         await self.similarity_repo.connect()
+        self._resources.append(("Similarity repository", self.similarity_repo))
         logger.info("Similarity repository connected")
 
         # Initialize RAG repository (ChromaDB)
         self.rag_repo = RAGRepository(self.config.similarity)
         await self.rag_repo.connect()
+        self._resources.append(("RAG repository", self.rag_repo))
         logger.info("RAG repository connected")
 
         # Initialize LLM providers
@@ -161,7 +180,9 @@ class ChibiBot(commands.Bot):
 
         # Load course configuration
         self.course = load_course()
-        logger.info(f"Course loaded: {self.course.name} with {len(self.course.modules)} modules")
+        logger.info(
+            "Course loaded: %s with %d modules", self.course.name, len(self.course.modules)
+        )
 
         # Initialize content loader and load module content
         self.content_loader = ContentLoader()
@@ -203,6 +224,7 @@ class ChibiBot(commands.Bot):
             self.config.similarity,
             api_key=self.config.openrouter_api_key,
         )
+        self._resources.append(("Embedding service", self.embedding_service))
         self.similarity_service = SimilarityService(
             config=self.config.similarity,
             embedding_service=self.embedding_service,
@@ -246,6 +268,15 @@ class ChibiBot(commands.Bot):
             )
             logger.info("Contextual chunking service initialized")
 
+        # Agent reply cache; the indexer clears it when content is re-indexed
+        response_cache = None
+        if self.config.agent.enabled and self.config.agent.response_cache_enabled:
+            response_cache = ResponseCache(
+                embedding_service=self.embedding_service,
+                similarity_threshold=self.config.agent.response_cache_threshold,
+                max_entries=self.config.agent.response_cache_size,
+            )
+
         self.content_indexer = ContentIndexer(
             embedding_service=self.embedding_service,
             rag_repo=self.rag_repo,
@@ -253,6 +284,7 @@ class ChibiBot(commands.Bot):
             chunk_overlap=100,
             contextual_chunking_service=contextual_service,
             use_contextual_retrieval=self.config.contextual_retrieval.enabled,
+            response_cache=response_cache,
         )
         logger.info("Services initialized")
 
@@ -281,7 +313,8 @@ class ChibiBot(commands.Bot):
         # Initialize tool registry and load tools
         self.tool_registry = ToolRegistry(self)
         await self.tool_registry.load_tools_from_directory()
-        logger.info(f"Tools loaded: {', '.join(self.tool_registry.get_tool_names())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Tools loaded: %s", ", ".join(self.tool_registry.get_tool_names()))
 
         # Initialize conversation memory
         self.conversation_memory = ConversationMemory(
@@ -305,6 +338,10 @@ class ChibiBot(commands.Bot):
                 tool_registry=self.tool_registry,
                 conversation_memory=self.conversation_memory,
                 course=self.course,
+                response_cache=response_cache,
+            )
+            self._nl_semaphore = asyncio.Semaphore(
+                self.config.agent.max_concurrent_nl or 8
             )
             logger.info("Main agent initialized")
 
@@ -339,24 +376,30 @@ class ChibiBot(commands.Bot):
 
         logger.error(f"App command error: {error}", exc_info=error)
 
-        # Try to respond to the user
+        # Try to respond to the user, failing fast so a degraded Discord API
+        # can't keep this handler alive past the interaction deadline
         try:
             if interaction.response.is_done():
-                await interaction.followup.send(
-                    "Oops! Something went wrong. Please try again! 🔧",
-                    ephemeral=True,
-                )
+                send = interaction.followup.send(ERROR_GENERIC, ephemeral=True)
             else:
-                await interaction.response.send_message(
-                    "Oops! Something went wrong. Please try again! 🔧",
-                    ephemeral=True,
-                )
-        except discord.NotFound:
-            # Interaction expired, can't respond
+                send = interaction.response.send_message(ERROR_GENERIC, ephemeral=True)
+            await asyncio.wait_for(send, timeout=DISCORD_ERROR_RESPONSE_TIMEOUT)
+        except (discord.NotFound, asyncio.TimeoutError):
+            # Interaction expired or Discord is too slow, can't respond
             pass
         except Exception as e:
             logger.error(f"Failed to send error response: {e}")
 
+    async def on_command_error(
+        self, ctx: commands.Context, error: commands.CommandError
+    ) -> None:
+        """Global error handler for prefix commands."""
+        if isinstance(error, AdminChannelCheckFailure):
+            await ctx.send(str(error))
+            return
+
+        await super().on_command_error(ctx, error)
+
     async def on_ready(self) -> None:
         """Called when the bot is ready."""
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
@@ -376,77 +419,119 @@ class ChibiBot(commands.Bot):
         when the bot is mentioned, and routes them through the LangGraph
         agent for intent classification and tool invocation.
         """
+        # Bind hot attributes once; this handler runs for every visible message
+        author = message.author
+        bot_user = self.user
+
         # Ignore messages from the bot itself
-        if message.author == self.user:
+        if author == bot_user:
             return
 
         # Ignore messages from other bots
-        if message.author.bot:
+        if author.bot:
             return
 
         # Process prefix commands first (e.g., !help)
         await self.process_commands(message)
 
         # Check if agent is enabled
-        if not self.config.agent.enabled or self.main_agent is None:
+        main_agent = self.main_agent
+        if not self.config.agent.enabled or main_agent is None:
             return
 
+        raw_content = message.content
+
         # Don't process if message starts with command prefix
-        if message.content.startswith(self.command_prefix):
+        if raw_content.startswith(self.command_prefix):
             return
 
         # Don't process empty messages
-        if not message.content.strip():
+        if not raw_content.strip():
             return
 
         # Determine if we should process this message
         should_process = False
-        is_dm = isinstance(message.channel, discord.DMChannel)
-        is_mentioned = self.user in message.mentions
+        channel = message.channel
+        is_dm = isinstance(channel, discord.DMChannel)
+        is_mentioned = bot_user in message.mentions
 
         # Always process DMs
         if is_dm:
             should_process = True
-            logger.debug(f"Processing DM from {message.author.display_name}")
+            logger.debug("Processing DM from %s", author.display_name)
 
         # Always process mentions
         elif is_mentioned:
             should_process = True
-            logger.debug(f"Processing mention from {message.author.display_name}")
+            logger.debug("Processing mention from %s", author.display_name)
 
         # Check if channel is in the configured NL routing channels
-        else:
-            channel_id = message.channel.id
-            nl_channels = self.config.agent.nl_routing_channels
-            if nl_channels and channel_id in nl_channels:
-                should_process = True
+        elif channel.id in self._nl_channels:
+            should_process = True
 
         if not should_process:
             return
 
         # Clean up message content (remove bot mention if present)
-        content = message.content
-        if is_mentioned and self.user:
-            content = content.replace(f"<@{self.user.id}>", "").strip()
-            content = content.replace(f"<@!{self.user.id}>", "").strip()
+        content = raw_content.strip()
+        if is_mentioned and bot_user:
+            content = content.replace(f"<@{bot_user.id}>", "").strip()
+            content = content.replace(f"<@!{bot_user.id}>", "").strip()
+
+        # A bare mention or a stray character would cost a full agent run
+        # (and its LLM calls) to answer nothing. Nudge users who addressed
+        # the bot directly; in routing channels just ignore the message.
+        if len(content) < NL_MIN_MESSAGE_LENGTH:
+            if is_dm or is_mentioned:
+                try:
+                    await message.reply(NL_MESSAGE_TOO_SHORT, mention_author=False)
+                except Exception:
+                    pass
+            return
 
+        # Lazy %-formatting: the string is only built if INFO is enabled
         logger.info(
-            f"Processing NL message from {message.author.display_name}: "
-            f"{content[:50]}..."
+            "Processing NL message from %s in channel %d: %.50s...",
+            author.display_name,
+            channel.id,
+            content,
         )
 
-        try:
-            # Invoke the main agent with cleaned content
-            await self.main_agent.invoke(message, cleaned_content=content)
-        except Exception as e:
-            logger.error(f"Error in main agent: {e}", exc_info=True)
+        # Drop instead of queueing when every agent slot is busy, so slow LLM
+        # round-trips can't pile up an unbounded backlog of pending messages
+        if self._nl_semaphore is not None and self._nl_semaphore.locked():
+            logger.warning("Agent busy, dropping NL message from %s", author.display_name)
             try:
                 await message.reply(
-                    "I encountered an error processing your request. Please try again.",
+                    "I'm a bit busy right now. Please try again in a moment!",
                     mention_author=False,
                 )
             except Exception:
                 pass
+            return
+
+        await self._run_nl(message, content)
+
+    async def _run_nl(self, message: discord.Message, content: str) -> None:
+        """Run the main agent for a message while holding an agent slot.
+
+        Args:
+            message: Discord message that triggered the agent
+            content: Cleaned message content
+        """
+        async with self._nl_semaphore:
+            try:
+                # Invoke the main agent with cleaned content
+                await self.main_agent.invoke(message, cleaned_content=content)
+            except Exception as e:
+                logger.error(f"Error in main agent: {e}", exc_info=True)
+                try:
+                    await message.reply(
+                        "I encountered an error processing your request. Please try again.",
+                        mention_author=False,
+                    )
+                except Exception:
+                    pass
 
     def _create_context_llm_manager(self, model: str) -> LLMManager:
         """Create a dedicated LLM manager for context generation.
@@ -517,17 +602,14 @@ class ChibiBot(commands.Bot):
         """Clean up on shutdown."""
         logger.info("Shutting down Chibi bot...")
 
-        if self.rag_repo:
-            await self.rag_repo.close()
-            logger.info("RAG repository closed")
-
-        if self.similarity_repo:
-            await self.similarity_repo.close()
-            logger.info("Similarity repository closed")
-
-        if self.database:
-            await self.database.close()
-            logger.info("Database closed")
+        # Close in reverse setup order; this also unwinds a partial setup_hook
+        while self._resources:
+            name, resource = self._resources.pop()
+            try:
+                await resource.close()
+                logger.info(f"{name} closed")
+            except Exception as e:
+                logger.error(f"Error closing {name}: {e}")
 
         await super().close()
 
@@ -4,11 +4,14 @@ Admin commands use prefix commands (!command) instead of slash commands
 to keep them hidden from students. They only work in the configured admin channel.
 """
 
+import asyncio
+import functools
 import io
 import logging
-import re
-from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+import time
+from collections import OrderedDict
+from itertools import repeat
+from typing import Optional, Tuple, TYPE_CHECKING
 
 import discord
 from discord.ext import commands
@@ -16,17 +19,23 @@ from discord.ext import commands
 from ..constants import (
     CSV_FILENAME_PREFIX,
     DESCRIPTION_TRUNCATE_LENGTH,
+    DISCORD_EMBED_FIELD_LIMIT,
     EMBED_FIELD_CHUNK_SIZE,
-    ERROR_ADMIN_CHANNEL_NOT_CONFIGURED,
-    ERROR_ADMIN_CHANNEL_ONLY,
     ERROR_MODULE_NOT_FOUND,
     ERROR_SHOW_GRADE,
     ERROR_STUDENT_NOT_FOUND,
     ERROR_STUDENT_STATUS,
+    GRADE_CSV_ZIP_THRESHOLD,
     MASTERY_EMOJI,
+    STATUS_EMBED_CACHE_SIZE,
+    STATUS_EMBED_CACHE_TTL,
+)
+from ..ui import chunk_lines, create_progress_bar, join_lines, truncate_text
+from .utils import (
+    admin_channel_only,
+    handle_prefix_command_errors,
+    timestamped_csv_filename,
 )
-from ..ui import create_progress_bar, truncate_text
-from .utils import handle_prefix_command_errors
 
 if TYPE_CHECKING:
     from ..bot import ChibiBot
@@ -35,10 +44,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Pattern to match Discord user mentions: <@123456789> or <@!123456789>
-MENTION_PATTERN = re.compile(r"<@!?(\d+)>")
+# Embed colors, built once instead of per embed
+COLOR_BLUE = discord.Color.blue()
+COLOR_GREEN = discord.Color.green()
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_user_id_from_mention(text: str) -> Optional[str]:
     """Extract Discord user ID from a mention string.
 
@@ -48,28 +59,12 @@ def extract_user_id_from_mention(text: str) -> Optional[str]:
     Returns:
         The user ID as a string if it's a mention, None otherwise
     """
-    match = MENTION_PATTERN.match(text)
-    if match:
-        return match.group(1)
-    return None
-
-
-def admin_channel_only():
-    """Check that ensures command is only used in the admin channel."""
-    async def predicate(ctx: commands.Context) -> bool:
-        bot: "ChibiBot" = ctx.bot
-        admin_channel_id = bot.config.discord.admin_channel_id
-
-        if admin_channel_id is None:
-            await ctx.send(ERROR_ADMIN_CHANNEL_NOT_CONFIGURED)
-            return False
+    # Mentions are <@id> or <@!id>; parse by slicing instead of a regex
+    if not (text.startswith("<@") and text.endswith(">")):
+        return None
 
-        if ctx.channel.id != admin_channel_id:
-            await ctx.send(f"{ERROR_ADMIN_CHANNEL_ONLY} Please use <#{admin_channel_id}>.")
-            return False
-
-        return True
-    return commands.check(predicate)
+    user_id = text[3:-1] if text[2] == "!" else text[2:-1]
+    return user_id if user_id.isdecimal() else None
 
 
 class AdminCog(commands.Cog):
@@ -82,6 +77,58 @@ class AdminCog(commands.Cog):
 
     def __init__(self, bot: "ChibiBot"):
         self.bot = bot
+        # user_repo.get_all() and mastery_repo.get_summary() are served from
+        # short TTL caches that the repositories clear on writes, so repeated
+        # admin commands can call them freely
+
+        # Key: (user_id, module_id, mastery version), Value: (created_at, embed)
+        self._status_cache: "OrderedDict[tuple, Tuple[float, discord.Embed]]" = OrderedDict()
+        # Static part of !help; only Quick Stats changes between calls
+        self._help_embed_template = self._build_help_embed_template()
+
+    @staticmethod
+    def _build_help_embed_template() -> discord.Embed:
+        """Build the static admin help embed (everything but Quick Stats)."""
+        embed = discord.Embed(
+            title="Admin Commands",
+            description="Use these commands to manage and monitor student progress.",
+            color=COLOR_BLUE,
+        )
+
+        # Commands as individual fields for better readability
+        embed.add_field(
+            name="`!help` or `!admin`",
+            value="Show this help message",
+            inline=False,
+        )
+        embed.add_field(
+            name="`!modules`",
+            value="List all available modules with details",
+            inline=False,
+        )
+        embed.add_field(
+            name="`!students`",
+            value="List all registered students with activity info",
+            inline=False,
+        )
+        embed.add_field(
+            name="`!show_grade [module]`",
+            value="Export student grades as CSV file\n*Optional: filter by module ID*",
+            inline=False,
+        )
+        embed.add_field(
+            name="`!status <student> [module]`",
+            value="View a student's learning progress\n*Accepts @mention, Discord ID, or username*",
+            inline=False,
+        )
+        embed.add_field(
+            name="`!clear_similarity [module]`",
+            value="Clear LLM Quiz similarity database\n*Optional: specify module to clear only that module*",
+            inline=False,
+        )
+
+        embed.set_footer(text="Use !modules or !students for detailed lists")
+        return embed
 
     @commands.command(name="help", aliases=["admin"])
     @commands.has_permissions(administrator=True)
@@ -92,56 +139,18 @@ class AdminCog(commands.Cog):
 
         Usage: !help or !admin
         """
-        async with ctx.typing():
-            embed = discord.Embed(
-                title="Admin Commands",
-                description="Use these commands to manage and monitor student progress.",
-                color=discord.Color.blue(),
-            )
-
-            # Commands as individual fields for better readability
-            embed.add_field(
-                name="`!help` or `!admin`",
-                value="Show this help message",
-                inline=False,
-            )
-            embed.add_field(
-                name="`!modules`",
-                value="List all available modules with details",
-                inline=False,
-            )
-            embed.add_field(
-                name="`!students`",
-                value="List all registered students with activity info",
-                inline=False,
-            )
-            embed.add_field(
-                name="`!show_grade [module]`",
-                value="Export student grades as CSV file\n*Optional: filter by module ID*",
-                inline=False,
-            )
-            embed.add_field(
-                name="`!status <student> [module]`",
-                value="View a student's learning progress\n*Accepts @mention, Discord ID, or username*",
-                inline=False,
-            )
-            embed.add_field(
-                name="`!clear_similarity [module]`",
-                value="Clear LLM Quiz similarity database\n*Optional: specify module to clear only that module*",
-                inline=False,
-            )
+        embed = self._help_embed_template.copy()
 
-            # Quick stats
-            modules = self.bot.course.modules
-            users = await self.bot.user_repo.get_all()
-            embed.add_field(
-                name="Quick Stats",
-                value=f"**{len(modules)}** modules | **{len(users)}** students registered",
-                inline=False,
-            )
+        # Quick stats
+        modules = self.bot.course.modules
+        users = await self.bot.user_repo.get_all()
+        embed.add_field(
+            name="Quick Stats",
+            value=f"**{len(modules)}** modules | **{len(users)}** students registered",
+            inline=False,
+        )
 
-            embed.set_footer(text="Use !modules or !students for detailed lists")
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.command(name="modules")
     @commands.has_permissions(administrator=True)
@@ -159,17 +168,20 @@ class AdminCog(commands.Cog):
 
         embed = discord.Embed(
             title=f"Available Modules ({len(modules)})",
-            color=discord.Color.green(),
+            color=COLOR_GREEN,
         )
 
-        for m in modules:
-            concept_count = len(m.concepts) if m.concepts else 0
-            description = truncate_text(
-                m.description, DESCRIPTION_TRUNCATE_LENGTH
-            ) if m.description else "No description"
+        # One line per module, packed into as few fields as fit; a field per
+        # module would hit Discord's 25-field limit on larger courses
+        lines = [
+            f"`{m.id}` - **{m.name}** *({m.concept_count} concepts)*\n"
+            + (truncate_text(m.description, DESCRIPTION_TRUNCATE_LENGTH) if m.description else "No description")
+            for m in modules
+        ]
+        for i, chunk in enumerate(chunk_lines(lines, DISCORD_EMBED_FIELD_LIMIT)):
             embed.add_field(
-                name=f"`{m.id}` - {m.name}",
-                value=f"{description}\n*{concept_count} concepts*",
+                name="Modules" if i == 0 else "Modules (cont.)",
+                value=chunk,
                 inline=False,
             )
 
@@ -184,36 +196,35 @@ class AdminCog(commands.Cog):
 
         Usage: !students
         """
-        async with ctx.typing():
-            users = await self.bot.user_repo.get_all()
+        users = await self.bot.user_repo.get_activity_list()
 
-            if not users:
-                await ctx.send("No students registered yet.")
-                return
+        if not users:
+            await ctx.send("No students registered yet.")
+            return
 
-            embed = discord.Embed(
-                title=f"Registered Students ({len(users)})",
-                color=discord.Color.green(),
-            )
+        embed = discord.Embed(
+            title=f"Registered Students ({len(users)})",
+            color=COLOR_GREEN,
+        )
 
-            # Build student list with activity info
-            lines = []
-            for u in users:
-                last_active = u.last_active.strftime("%Y-%m-%d") if u.last_active else "Never"
-                lines.append(f"`{u.discord_id}` - **{u.username}** (Last: {last_active})")
-
-            # Split into chunks if too many students (embed field limit is 1024 chars)
-            for i in range(0, len(lines), EMBED_FIELD_CHUNK_SIZE):
-                chunk = lines[i:i + EMBED_FIELD_CHUNK_SIZE]
-                field_name = "Students" if i == 0 else f"Students (cont.)"
-                embed.add_field(
-                    name=field_name,
-                    value="\n".join(chunk),
-                    inline=False,
-                )
+        # Build student list with activity info
+        lines = [
+            f"`{discord_id}` - **{username}** (Last: {last_active or 'Never'})"
+            for discord_id, username, last_active in users
+        ]
 
-            embed.set_footer(text="Use !status <student> to view a student's progress")
-            await ctx.send(embed=embed)
+        # Split into chunks if too many students (embed field limit is 1024 chars)
+        for i in range(0, len(lines), EMBED_FIELD_CHUNK_SIZE):
+            chunk = lines[i:i + EMBED_FIELD_CHUNK_SIZE]
+            field_name = "Students" if i == 0 else f"Students (cont.)"
+            embed.add_field(
+                name=field_name,
+                value="\n".join(chunk),
+                inline=False,
+            )
+
+        embed.set_footer(text="Use !status <student> to view a student's progress")
+        await ctx.send(embed=embed)
 
     @commands.command(name="show_grade")
     @commands.has_permissions(administrator=True)
@@ -231,34 +242,49 @@ class AdminCog(commands.Cog):
         Args:
             module: Optional module ID to filter by
         """
-        async with ctx.typing():
-            # Validate module if specified
-            target_module = None
-            if module:
-                target_module = self.bot.course.get_module(module)
-                if not target_module:
-                    await ctx.send(ERROR_MODULE_NOT_FOUND)
-                    return
+        # Validate module if specified
+        target_module = None
+        if module:
+            target_module = self.bot.course.get_module(module)
+            if not target_module:
+                await ctx.send(ERROR_MODULE_NOT_FOUND)
+                return
 
+        # Only show typing for the report itself; the indicator is an extra
+        # REST call that would outlast cheap replies like the error above
+        async with ctx.typing():
             # Generate CSV data using grade service
-            csv_content = await self.bot.grade_service.generate_grade_csv(target_module)
+            csv_file = await self.bot.grade_service.generate_grade_csv_file(target_module)
+
+            # discord.File leaves caller-owned file objects open, so release
+            # the spooled report (and any spill file on disk) ourselves
+            try:
+                # Create file object
+                filename = timestamped_csv_filename(
+                    CSV_FILENAME_PREFIX, f"_{module}" if module else ""
+                )
 
-            # Create file object
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            module_suffix = f"_{module}" if module else ""
-            filename = f"{CSV_FILENAME_PREFIX}{module_suffix}_{timestamp}.csv"
+                # Zip large reports so they stay under Discord's upload limit
+                if csv_file.seek(0, io.SEEK_END) > GRADE_CSV_ZIP_THRESHOLD:
+                    zip_file = await self.bot.grade_service.compress_grade_csv_file(
+                        csv_file, filename
+                    )
+                    csv_file.close()
+                    csv_file = zip_file
+                    filename = filename.removesuffix(".csv") + ".zip"
+                else:
+                    csv_file.seek(0)
 
-            file = discord.File(
-                io.BytesIO(csv_content.encode("utf-8")),
-                filename=filename
-            )
+                file = discord.File(csv_file, filename=filename)
 
-            # Send the file
-            module_info = f" for module **{target_module.name}**" if target_module else ""
-            await ctx.send(
-                f"Grade report{module_info} generated successfully.",
-                file=file
-            )
+                # Send the file; discord.py reads it straight from the spool
+                module_info = f" for module **{target_module.name}**" if target_module else ""
+                await ctx.send(
+                    f"Grade report{module_info} generated successfully.",
+                    file=file
+                )
+            finally:
+                csv_file.close()
 
     @commands.command(name="status")
     @commands.has_permissions(administrator=True)
@@ -293,7 +319,6 @@ class AdminCog(commands.Cog):
             user = await self.bot.user_repo.search_by_identifier(identifier)
             if not user:
                 # Check if it's a valid Discord user who just hasn't used the bot yet
-                mention_id = extract_user_id_from_mention(student)
                 if mention_id:
                     await ctx.send(
                         f"User <@{mention_id}> hasn't taken any quizzes yet. "
@@ -311,30 +336,69 @@ class AdminCog(commands.Cog):
                     await ctx.send(ERROR_MODULE_NOT_FOUND)
                     return
 
-            # Build the appropriate embed
-            if target_module is None:
-                embed = await self._build_student_summary_embed(user)
-            else:
-                embed = await self._build_student_module_embed(user, target_module)
+            # Reuse a recent render; every quiz answer writes mastery, which
+            # bumps the user's mastery version and so misses the cache
+            mastery_version = self.bot.mastery_repo.get_version(user.id)
+            cache_key = (user.id, module, mastery_version)
+            embed = self._get_cached_status_embed(cache_key)
+            if embed is None:
+                if target_module is None:
+                    embed = await self._build_student_summary_embed(user)
+                else:
+                    embed = await self._build_student_module_embed(user, target_module)
+                self._cache_status_embed(cache_key, embed)
 
             await ctx.send(embed=embed)
 
+    def _get_cached_status_embed(self, key: tuple) -> Optional[discord.Embed]:
+        """Get a cached status embed if it is still within the TTL."""
+        entry = self._status_cache.get(key)
+        if entry is None:
+            return None
+
+        created_at, embed = entry
+        if time.monotonic() - created_at > STATUS_EMBED_CACHE_TTL:
+            del self._status_cache[key]
+            return None
+
+        self._status_cache.move_to_end(key)
+        return embed
+
+    def _cache_status_embed(self, key: tuple, embed: discord.Embed) -> None:
+        """Cache a rendered status embed, evicting the least recently used."""
+        self._status_cache[key] = (time.monotonic(), embed)
+        self._status_cache.move_to_end(key)
+        while len(self._status_cache) > STATUS_EMBED_CACHE_SIZE:
+            self._status_cache.popitem(last=False)
+
     async def _build_student_summary_embed(self, user: "User") -> discord.Embed:
         """Build summary status embed for a student."""
+        # The reads below are independent, so issue them together
+        async with asyncio.TaskGroup() as tg:
+            mastery_task = tg.create_task(
+                self.bot.mastery_repo.get_all_for_user(user.id)
+            )
+            counts_task = tg.create_task(
+                self.bot.quiz_repo.get_attempt_counts(user.id)
+            )
+
         # Get mastery records and config
-        mastery_records = await self.bot.mastery_repo.get_all_for_user(user.id)
-        mastery_by_concept = {m.concept_id: m for m in mastery_records}
+        mastery_records = mastery_task.result()
         min_attempts = self.bot.config.mastery.min_attempts_for_mastery
+        # Cap correct_attempts at min_attempts once per concept
+        passed_by_concept = {
+            m.concept_id: min(m.correct_attempts, min_attempts)
+            for m in mastery_records
+        }
 
         embed = discord.Embed(
             title=f"📊 Learning Progress - {user.username}",
             description=f"Discord ID: `{user.discord_id}`",
-            color=discord.Color.blue(),
+            color=COLOR_BLUE,
         )
 
         # Quiz stats (fetched from quiz_attempts table)
-        total_quizzes = await self.bot.quiz_repo.count_for_user(user.id)
-        correct = await self.bot.quiz_repo.count_correct_for_user(user.id)
+        total_quizzes, correct = counts_task.result()
         accuracy = correct / total_quizzes * 100 if total_quizzes > 0 else 0
 
         embed.add_field(
@@ -346,22 +410,15 @@ class AdminCog(commands.Cog):
 
         # Calculate overall passed/required
         total_passed = 0
-        total_required = 0
+        total_required = self.bot.course.total_concept_count * min_attempts
 
         # Module progress bars
         module_lines = []
+        passed_get = passed_by_concept.get
         for module in self.bot.course.modules:
-            module_passed = 0
-            module_required = len(module.concepts) * min_attempts
-
-            for concept in module.concepts:
-                mastery = mastery_by_concept.get(concept.id)
-                if mastery:
-                    # Cap correct_attempts at min_attempts per concept
-                    module_passed += min(mastery.correct_attempts, min_attempts)
-
+            module_required = module.concept_count * min_attempts
+            module_passed = sum(map(passed_get, module.concept_ids, repeat(0)))
             total_passed += module_passed
-            total_required += module_required
 
             # Create progress bar for this module
             progress_bar = create_progress_bar(module_passed, module_required)
@@ -402,32 +459,33 @@ class AdminCog(commands.Cog):
             title=f"📚 {module.name} - {user.username}",
             description=f"Discord ID: `{user.discord_id}`"
             + (f"\n{module.description}" if module.description else ""),
-            color=discord.Color.blue(),
+            color=COLOR_BLUE,
         )
 
-        # Get mastery records and config
-        mastery_records = await self.bot.mastery_repo.get_all_for_user(user.id)
+        # Fetch mastery only for this module's concepts
+        mastery_records = await self.bot.mastery_repo.get_by_concepts(
+            user.id, list(module.concept_ids)
+        )
         mastery_by_concept = {m.concept_id: m for m in mastery_records}
         min_attempts = self.bot.config.mastery.min_attempts_for_mastery
 
-        # Calculate module progress
-        module_passed = 0
-        module_required = len(module.concepts) * min_attempts
-
-        concept_lines = []
-        for concept in module.concepts:
-            mastery = mastery_by_concept.get(concept.id)
-            if mastery:
-                # Cap correct_attempts at min_attempts per concept
-                capped_correct = min(mastery.correct_attempts, min_attempts)
-                module_passed += capped_correct
-
-                emoji = MASTERY_EMOJI.get(mastery.mastery_level, "⬜")
-                concept_lines.append(
-                    f"{emoji} **{concept.name}** ({capped_correct}/{min_attempts} passed)"
-                )
-            else:
-                concept_lines.append(f"⬜ {concept.name} (0/{min_attempts} passed)")
+        # Every fetched record belongs to this module
+        module_required = module.concept_count * min_attempts
+        module_passed = sum(
+            min(mastery.correct_attempts, min_attempts)
+            for mastery in mastery_records
+        )
+
+        emoji_get = MASTERY_EMOJI.get
+        mastery_get = mastery_by_concept.get
+        concept_lines = [
+            # Cap correct_attempts at min_attempts per concept
+            f"{emoji_get(mastery.mastery_level, '⬜')} **{concept.name}** "
+            f"({min(mastery.correct_attempts, min_attempts)}/{min_attempts} passed)"
+            if (mastery := mastery_get(concept.id))
+            else f"⬜ {concept.name} (0/{min_attempts} passed)"
+            for concept in module.concepts
+        ]
 
         # Module summary with progress bar
         progress_bar = create_progress_bar(module_passed, module_required)
@@ -443,7 +501,7 @@ class AdminCog(commands.Cog):
         if concept_lines:
             embed.add_field(
                 name="Concepts",
-                value="\n".join(concept_lines),
+                value=join_lines(concept_lines, DISCORD_EMBED_FIELD_LIMIT),
                 inline=False,
             )
 
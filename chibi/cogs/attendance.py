@@ -16,8 +16,6 @@ from discord.ext import commands
 
 from ..constants import (
     ATTENDANCE_CSV_PREFIX,
-    ERROR_ADMIN_CHANNEL_NOT_CONFIGURED,
-    ERROR_ADMIN_CHANNEL_ONLY,
     ERROR_ATTENDANCE_CHANNEL_NOT_CONFIGURED,
     ERROR_ATTENDANCE_CHANNEL_ONLY,
     ERROR_ATTENDANCE_EXPORT,
@@ -35,10 +33,12 @@ from ..utils.errors import (
     SessionAlreadyActiveError,
 )
 from .utils import (
+    admin_channel_only,
     defer_interaction,
     get_or_create_user_from_interaction,
     handle_prefix_command_errors,
     handle_slash_command_errors,
+    timestamped_csv_filename,
 )
 
 if TYPE_CHECKING:
@@ -47,26 +47,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def admin_channel_only():
-    """Check that ensures command is only used in the admin channel."""
-
-    async def predicate(ctx: commands.Context) -> bool:
-        bot: "ChibiBot" = ctx.bot
-        admin_channel_id = bot.config.discord.admin_channel_id
-
-        if admin_channel_id is None:
-            await ctx.send(ERROR_ADMIN_CHANNEL_NOT_CONFIGURED)
-            return False
-
-        if ctx.channel.id != admin_channel_id:
-            await ctx.send(f"{ERROR_ADMIN_CHANNEL_ONLY} Please use <#{admin_channel_id}>.")
-            return False
-
-        return True
-
-    return commands.check(predicate)
-
-
 def attendance_channel_only():
     """Check that ensures slash command is only used in the attendance channel."""
 
@@ -422,11 +402,10 @@ class AttendanceCog(commands.Cog):
                 return
 
             # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             if session_id:
                 filename = f"{ATTENDANCE_CSV_PREFIX}_{session_id}.csv"
             else:
-                filename = f"{ATTENDANCE_CSV_PREFIX}_all_{timestamp}.csv"
+                filename = timestamped_csv_filename(ATTENDANCE_CSV_PREFIX, "_all")
 
             # Send the file
             file = discord.File(
@@ -1,7 +1,7 @@
 """Modules command cog for listing available course modules."""
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import discord
 from discord import app_commands
@@ -11,6 +11,7 @@ from .utils import defer_interaction, handle_slash_command_errors
 
 if TYPE_CHECKING:
     from ..bot import ChibiBot
+    from ..content.course import Module
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +23,17 @@ class ModulesCog(commands.Cog):
 
     def __init__(self, bot: "ChibiBot"):
         self.bot = bot
+        # (course, embed) for the last built module list; the listing only
+        # changes with the course, so it is reused across /modules calls
+        self._modules_embed_cache: Optional[Tuple[Any, discord.Embed]] = None
 
     @app_commands.command(name="modules", description="List all available course modules")
     @defer_interaction(thinking=False)
     @handle_slash_command_errors(error_message=ERROR_MODULES, context="/modules")
     async def modules(self, interaction: discord.Interaction):
         """List all available modules in the course."""
-        modules = self.bot.course.modules
+        course = self.bot.course
+        modules = course.modules
 
         if not modules:
             await interaction.followup.send(
@@ -37,6 +42,23 @@ class ModulesCog(commands.Cog):
             )
             return
 
+        cached = self._modules_embed_cache
+        if cached is None or cached[0] is not course:
+            cached = (course, self._build_modules_embed(modules))
+            self._modules_embed_cache = cached
+
+        await interaction.followup.send(embed=cached[1])
+
+    @staticmethod
+    def _build_modules_embed(modules: List["Module"]) -> discord.Embed:
+        """Build the /modules embed listing every module.
+
+        Args:
+            modules: Course modules to list
+
+        Returns:
+            Embed with module lines split across fields
+        """
         embed = discord.Embed(
             title="📚 Available Modules",
             description=f"There are **{len(modules)}** modules in this course.",
@@ -46,7 +68,7 @@ class ModulesCog(commands.Cog):
         # Group modules into chunks to avoid field limit
         module_lines = []
         for module in modules:
-            concept_count = len(module.concepts) if module.concepts else 0
+            concept_count = module.concept_count
             description = module.description[:80] + "..." if module.description and len(module.description) > 80 else (module.description or "No description")
             module_lines.append(
                 f"**`{module.id}`** - {module.name}\n"
@@ -83,7 +105,7 @@ class ModulesCog(commands.Cog):
             text="Use the module ID (e.g., 'quiz me on module-1' or 'llm quiz module-1')"
         )
 
-        await interaction.followup.send(embed=embed)
+        return embed
 
 
 async def setup(bot: "ChibiBot"):
@@ -1,5 +1,6 @@
 """Quiz command cog for quiz interactions."""
 
+import asyncio
 import logging
 import random
 from typing import List, Optional, TYPE_CHECKING
@@ -87,15 +88,18 @@ class QuizAnswerModal(discord.ui.Modal, title="Quiz"):
                 )
                 return
 
-            # Log attempt and update mastery
-            await self.cog.bot.quiz_service.log_attempt_and_update_mastery(
-                user_id=self.db_user_id,
-                module_id=self.module_id,
-                concept_id=self.concept_id,
-                question=self.question,
-                user_answer=student_answer,
-                correct_answer=self.correct_answer,
-                result=result,
+            # Log attempt and update mastery while the feedback is sent, so
+            # the student isn't kept waiting on the writes
+            record_task = asyncio.create_task(
+                self.cog.bot.quiz_service.log_attempt_and_update_mastery(
+                    user_id=self.db_user_id,
+                    module_id=self.module_id,
+                    concept_id=self.concept_id,
+                    question=self.question,
+                    user_answer=student_answer,
+                    correct_answer=self.correct_answer,
+                    result=result,
+                )
             )
 
             # Send feedback
@@ -107,7 +111,15 @@ class QuizAnswerModal(discord.ui.Modal, title="Quiz"):
                 concept_name=self.concept_name,
             )
 
-            await interaction.followup.send(embed=embed)
+            try:
+                await interaction.followup.send(embed=embed)
+            finally:
+                # Record the attempt even if sending failed; a failed write
+                # must not turn feedback already shown into an error
+                try:
+                    await record_task
+                except Exception as e:
+                    logger.error(f"Failed to record quiz attempt: {e}", exc_info=True)
 
             logger.info(
                 f"Quiz evaluated for {interaction.user.display_name}: "
@@ -1,5 +1,6 @@
 """Status command cog for learning progress tracking."""
 
+import asyncio
 import logging
 from typing import List, Optional, TYPE_CHECKING
 
@@ -8,10 +9,11 @@ from discord import app_commands
 from discord.ext import commands
 
 from ..constants import (
+    DISCORD_EMBED_FIELD_LIMIT,
     ERROR_MODULE_NOT_FOUND,
     ERROR_STATUS,
 )
-from ..ui import create_progress_bar, get_mastery_emoji
+from ..ui import create_progress_bar, get_mastery_emoji, join_lines
 from .utils import (
     defer_interaction,
     get_or_create_user_from_interaction,
@@ -75,8 +77,20 @@ class StatusCog(commands.Cog):
         self, user_id: int, discord_user: discord.User
     ) -> discord.Embed:
         """Build summary status embed."""
+        # The reads below are independent, so issue them together
+        async with asyncio.TaskGroup() as tg:
+            mastery_task = tg.create_task(
+                self.bot.mastery_repo.get_all_for_user(user_id)
+            )
+            counts_task = tg.create_task(
+                self.bot.quiz_repo.get_attempt_counts(user_id)
+            )
+            llm_quiz_task = tg.create_task(
+                self.bot.llm_quiz_service.get_all_progress(user_id)
+            )
+
         # Get mastery records and config
-        mastery_records = await self.bot.mastery_repo.get_all_for_user(user_id)
+        mastery_records = mastery_task.result()
         mastery_by_concept = {m.concept_id: m for m in mastery_records}
         min_attempts = self.bot.config.mastery.min_attempts_for_mastery
 
@@ -86,8 +100,7 @@ class StatusCog(commands.Cog):
         )
 
         # Quiz stats (fetched from quiz_attempts table)
-        total_quizzes = await self.bot.quiz_repo.count_for_user(user_id)
-        correct = await self.bot.quiz_repo.count_correct_for_user(user_id)
+        total_quizzes, correct = counts_task.result()
         accuracy = correct / total_quizzes * 100 if total_quizzes > 0 else 0
 
         embed.add_field(
@@ -99,7 +112,7 @@ class StatusCog(commands.Cog):
 
         # Calculate overall passed/required
         total_passed = 0
-        total_required = 0
+        total_required = self.bot.course.total_concept_count * min_attempts
 
         # Module progress bars
         module_lines = []
@@ -114,7 +127,6 @@ class StatusCog(commands.Cog):
                     module_passed += min(mastery.correct_attempts, min_attempts)
 
             total_passed += module_passed
-            total_required += module_required
 
             # Create progress bar for this module
             progress_bar = create_progress_bar(module_passed, module_required)
@@ -136,7 +148,7 @@ class StatusCog(commands.Cog):
         )
 
         # LLM Quiz Challenge progress
-        llm_quiz_progress = await self.bot.llm_quiz_service.get_all_progress(user_id)
+        llm_quiz_progress = llm_quiz_task.result()
         if llm_quiz_progress:
             progress_lines = []
             for module_id, (wins, target) in llm_quiz_progress.items():
@@ -171,8 +183,10 @@ class StatusCog(commands.Cog):
             color=discord.Color.blue(),
         )
 
-        # Get mastery records and config
-        mastery_records = await self.bot.mastery_repo.get_all_for_user(user_id)
+        # Fetch mastery only for this module's concepts
+        mastery_records = await self.bot.mastery_repo.get_by_concepts(
+            user_id, list(module.concept_ids)
+        )
         mastery_by_concept = {m.concept_id: m for m in mastery_records}
         min_attempts = self.bot.config.mastery.min_attempts_for_mastery
 
@@ -209,7 +223,7 @@ class StatusCog(commands.Cog):
         if concept_lines:
             embed.add_field(
                 name="Concepts",
-                value="\n".join(concept_lines),
+                value=join_lines(concept_lines, DISCORD_EMBED_FIELD_LIMIT),
                 inline=False,
             )
 
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import time
 from typing import Callable, List, TYPE_CHECKING
 
 import discord
@@ -12,7 +13,10 @@ from ..constants import (
     DISCORD_AUTOCOMPLETE_LIMIT,
     DISCORD_CHUNK_SIZE,
     DISCORD_MESSAGE_LIMIT,
+    ERROR_ADMIN_CHANNEL_NOT_CONFIGURED,
+    ERROR_ADMIN_CHANNEL_ONLY,
     ERROR_GENERIC,
+    NO_MENTIONS,
 )
 
 if TYPE_CHECKING:
@@ -23,6 +27,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class AdminChannelCheckFailure(commands.CheckFailure):
+    """Raised when an admin command is used outside the admin channel.
+
+    The message is user-facing; the bot's on_command_error sends it.
+    """
+
+
+def admin_channel_only():
+    """Check that ensures command is only used in the admin channel.
+
+    The predicate is synchronous, so rejected commands don't schedule a
+    coroutine or send from inside the check.
+    """
+    def predicate(ctx: commands.Context) -> bool:
+        admin_channel_id = ctx.bot.admin_channel_id
+
+        if admin_channel_id is None:
+            raise AdminChannelCheckFailure(ERROR_ADMIN_CHANNEL_NOT_CONFIGURED)
+
+        if ctx.channel.id != admin_channel_id:
+            raise AdminChannelCheckFailure(
+                f"{ERROR_ADMIN_CHANNEL_ONLY} Please use <#{admin_channel_id}>."
+            )
+
+        return True
+    return commands.check(predicate)
+
+
 def defer_interaction(thinking: bool = True):
     """Decorator to handle interaction deferral with error handling.
 
@@ -77,6 +109,19 @@ async def get_or_create_user_from_interaction(
     )
 
 
+def timestamped_csv_filename(prefix: str, suffix: str = "") -> str:
+    """Build a CSV export filename stamped with the current local time.
+
+    Args:
+        prefix: Filename prefix (e.g. CSV_FILENAME_PREFIX)
+        suffix: Optional text placed between the prefix and the timestamp
+
+    Returns:
+        Filename like "<prefix><suffix>_YYYYmmdd_HHMMSS.csv"
+    """
+    return f"{prefix}{suffix}_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+
+
 async def send_chunked_response(
     interaction: discord.Interaction,
     content: str,
@@ -88,12 +133,13 @@ async def send_chunked_response(
         content: The content to send
     """
     if len(content) <= DISCORD_MESSAGE_LIMIT:
-        await interaction.followup.send(content)
+        await interaction.followup.send(content, allowed_mentions=NO_MENTIONS)
         return
 
-    chunks = [content[i:i + DISCORD_CHUNK_SIZE] for i in range(0, len(content), DISCORD_CHUNK_SIZE)]
-    for chunk in chunks:
-        await interaction.followup.send(chunk)
+    for start in range(0, len(content), DISCORD_CHUNK_SIZE):
+        await interaction.followup.send(
+            content[start:start + DISCORD_CHUNK_SIZE], allowed_mentions=NO_MENTIONS
+        )
 
 
 async def module_autocomplete_choices(
@@ -112,15 +158,18 @@ async def module_autocomplete_choices(
     if not course:
         return []
 
+    current = current.lower()
     choices = []
-    for module in course.modules:
-        display_name = f"{module.id}: {module.name}"
-        if current.lower() in display_name.lower():
+    for lowered, display_name, module_id in course.module_search_index:
+        if current in lowered:
             choices.append(
-                app_commands.Choice(name=display_name[:100], value=module.id)
+                app_commands.Choice(name=display_name[:100], value=module_id)
             )
+            # Discord shows at most this many; skip scanning the rest
+            if len(choices) == DISCORD_AUTOCOMPLETE_LIMIT:
+                break
 
-    return choices[:DISCORD_AUTOCOMPLETE_LIMIT]
+    return choices
 
 
 def handle_slash_command_errors(
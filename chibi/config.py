@@ -105,6 +105,12 @@ class AgentConfig:
     max_conversation_history: int = 20
     # Whether the agent is enabled (if False, only slash commands work)
     enabled: bool = True
+    # Maximum number of NL messages processed by the agent at the same time
+    max_concurrent_nl: int = 8
+    # Semantic cache of course Q&A replies (skips the agent on similar questions)
+    response_cache_enabled: bool = True
+    response_cache_threshold: float = 0.95
+    response_cache_size: int = 256
 
 
 @dataclass
@@ -262,6 +268,10 @@ def load_config(config_path: str = "config.yaml") -> Config:
             intent_confidence_threshold=agent_data.get("intent_confidence_threshold", 0.7),
             max_conversation_history=agent_data.get("max_conversation_history", 20),
             enabled=agent_data.get("enabled", True),
+            max_concurrent_nl=agent_data.get("max_concurrent_nl", 8),
+            response_cache_enabled=agent_data.get("response_cache_enabled", True),
+            response_cache_threshold=agent_data.get("response_cache_threshold", 0.95),
+            response_cache_size=agent_data.get("response_cache_size", 256),
         ),
         attendance=AttendanceConfig(
             attendance_channel_id=attendance_channel_id,
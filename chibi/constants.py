@@ -1,9 +1,16 @@
 """Constants for Chibi bot."""
 
+import discord
+
 # Discord platform limits
 DISCORD_MESSAGE_LIMIT = 2000
 DISCORD_CHUNK_SIZE = 1990
 DISCORD_AUTOCOMPLETE_LIMIT = 25
+DISCORD_EMBED_FIELD_LIMIT = 1024
+DISCORD_ERROR_RESPONSE_TIMEOUT = 1.5  # Seconds to wait on error replies before giving up
+
+# Bot text (often LLM output) is sent without pinging anyone it happens to name
+NO_MENTIONS = discord.AllowedMentions.none()
 
 # Quiz settings
 QUIZ_TIMEOUT_MINUTES = 30
@@ -18,6 +25,10 @@ TEMPERATURE_EVALUATION = 0.3
 MODULE_CONTENT_MAX_LENGTH = 4000
 QUIZ_CONTENT_MAX_LENGTH = 3000
 
+# Natural language routing
+NL_MIN_MESSAGE_LENGTH = 2  # Shorter messages (e.g. a bare mention) skip the agent
+NL_MESSAGE_TOO_SHORT = "Hi! Ask me a question about the course and I'll do my best to help. 😊"
+
 # Display limits for status embeds
 CONCEPTS_PER_MODULE_LIMIT = 10
 CONCEPTS_PER_LEVEL_LIMIT = 8
@@ -35,6 +46,9 @@ MASTERY_LEARNING = "learning"
 MASTERY_PROFICIENT = "proficient"
 MASTERY_MASTERED = "mastered"
 
+# Mastery levels that count a concept as completed
+MASTERY_COMPLETED_LEVELS = frozenset({MASTERY_PROFICIENT, MASTERY_MASTERED})
+
 # Mastery emoji mapping
 MASTERY_EMOJI = {
     MASTERY_MASTERED: "🏆",
@@ -56,10 +70,20 @@ ERROR_SHOW_GRADE = "Failed to generate grade report. Please try again."
 ERROR_STUDENT_NOT_FOUND = "Could not find a student with that identifier. Please check the Discord ID or username."
 ERROR_STUDENT_STATUS = "Failed to fetch student status. Please try again."
 
+# Repository read caches
+REPOSITORY_CACHE_TTL = 30.0  # Seconds cached user lists / mastery summaries stay fresh
+
+# Embedding cache
+EMBEDDING_CACHE_SIZE = 1024  # Texts whose embeddings are kept in memory (LRU)
+
 # Admin command settings
 CSV_FILENAME_PREFIX = "student_grades"
+GRADE_CSV_SPOOL_MAX_SIZE = 1_048_576  # Bytes kept in memory before a grade CSV spills to disk
+GRADE_CSV_ZIP_THRESHOLD = 4_194_304  # Grade CSVs larger than this are sent zipped
 EMBED_FIELD_CHUNK_SIZE = 15  # Max items per embed field for student lists
 DESCRIPTION_TRUNCATE_LENGTH = 100  # Max length for truncated descriptions
+STATUS_EMBED_CACHE_TTL = 30.0  # Seconds a rendered !status embed is reused
+STATUS_EMBED_CACHE_SIZE = 128  # Max cached !status embeds
 
 # Attendance error messages
 ERROR_ATTENDANCE_SESSION_ACTIVE = "An attendance session is already active. Please close it first."
@@ -1,8 +1,9 @@
 """Course and module data models."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -30,6 +31,10 @@ class Module:
     content_urls: List[str] = field(default_factory=list)
     concepts: List[Concept] = field(default_factory=list)
     contents: Dict[str, str] = field(default_factory=dict)  # URL -> content mapping
+    # (contents dict, joined text) from the last get_all_content() call
+    _all_content: Optional[Tuple[Dict[str, str], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_concept(self, concept_id: str) -> Optional[Concept]:
         """Get a concept by ID."""
@@ -42,13 +47,32 @@ class Module:
         """Get all concept names."""
         return [c.name for c in self.concepts]
 
+    @cached_property
+    def concept_ids(self) -> Tuple[str, ...]:
+        """IDs of this module's concepts, in order."""
+        return tuple(c.id for c in self.concepts)
+
+    @cached_property
+    def concept_count(self) -> int:
+        """Number of concepts in this module."""
+        return len(self.concepts)
+
     def get_all_content(self) -> str:
         """Get all content from all URLs concatenated.
 
+        The joined text is reused until ``contents`` is replaced, which the
+        content loader does whenever it (re)loads a module.
+
         Returns:
             All URL contents joined with newlines
         """
-        return "\n\n".join(self.contents.values())
+        cached = self._all_content
+        if cached is not None and cached[0] is self.contents:
+            return cached[1]
+
+        all_content = "\n\n".join(self.contents.values())
+        self._all_content = (self.contents, all_content)
+        return all_content
 
 
 @dataclass
@@ -69,13 +93,22 @@ class Course:
     description: str = ""
     modules: List[Module] = field(default_factory=list)
     quiz_formats: List[QuizFormat] = field(default_factory=list)
+    _modules_by_id: Dict[str, Module] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Modules are fixed once the course is loaded, so index them up front
+        self._modules_by_id = {module.id: module for module in self.modules}
 
     def get_module(self, module_id: str) -> Optional[Module]:
         """Get a module by ID."""
-        for module in self.modules:
-            if module.id == module_id:
-                return module
-        return None
+        return self._modules_by_id.get(module_id)
+
+    @cached_property
+    def total_concept_count(self) -> int:
+        """Total number of concepts across all modules."""
+        return sum(module.concept_count for module in self.modules)
 
     def get_module_choices(self) -> List[tuple]:
         """Get module choices for Discord autocomplete.
@@ -85,18 +118,35 @@ class Course:
         """
         return [(f"{m.id}: {m.name}", m.id) for m in self.modules]
 
-    def get_all_concepts(self) -> Dict[str, Concept]:
-        """Get all concepts across all modules.
+    @cached_property
+    def module_search_index(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Module autocomplete entries, lowercased once per course load.
 
         Returns:
-            Dict mapping concept_id to Concept
+            Tuple of (lowercased display name, display name, module_id)
         """
+        return tuple(
+            (display_name.lower(), display_name, module_id)
+            for display_name, module_id in self.get_module_choices()
+        )
+
+    @cached_property
+    def all_concepts(self) -> Dict[str, Concept]:
+        """All concepts across all modules, built once per course load."""
         concepts = {}
         for module in self.modules:
             for concept in module.concepts:
                 concepts[concept.id] = concept
         return concepts
 
+    def get_all_concepts(self) -> Dict[str, Concept]:
+        """Get all concepts across all modules.
+
+        Returns:
+            Dict mapping concept_id to Concept (a copy safe to modify)
+        """
+        return dict(self.all_concepts)
+
     def get_quiz_format(self, format_id: str) -> Optional[QuizFormat]:
         """Get a quiz format by ID."""
         for fmt in self.quiz_formats:
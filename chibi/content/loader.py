@@ -1,7 +1,10 @@
 """Content loader for fetching module content from URLs."""
 
+import hashlib
+import json
 import logging
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 
 import httpx
 
@@ -9,13 +12,26 @@ from .course import Course, Module
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = "data/content_cache"
 
-class ContentLoader:
-    """Loads and caches module content from URLs."""
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+class ContentLoader:
+    """Loads and caches module content from URLs.
+
+    Fetched content is also persisted to ``cache_dir`` (one JSON file per URL)
+    together with the response's ETag/Last-Modified validators, so restarts
+    revalidate with a conditional GET instead of re-downloading everything.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    ):
         self.timeout = timeout
         self.max_retries = max_retries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self._cache: Dict[str, str] = {}
 
     async def load_module_content(self, module: Module) -> Dict[str, str]:
@@ -77,17 +93,32 @@ class ContentLoader:
     async def _fetch_url(self, url: str) -> str:
         """Fetch content from a URL with retries.
 
+        Sends a conditional request when a disk-cached copy exists and reuses
+        that copy on 304 Not Modified or when every attempt fails.
+
         Args:
             url: The URL to fetch
 
         Returns:
             The content as a string, or empty string on failure
         """
+        cached = self._read_disk_cache(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         for attempt in range(self.max_retries):
             try:
                 async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url)
+                    response = await client.get(url, headers=headers)
+                    if cached and response.status_code == 304:
+                        logger.debug(f"Content not modified, using disk cache: {url}")
+                        return cached["content"]
                     response.raise_for_status()
+                    self._write_disk_cache(url, response)
                     return response.text
 
             except httpx.TimeoutException:
@@ -98,8 +129,74 @@ class ContentLoader:
             except Exception as e:
                 logger.error(f"Error fetching {url}: {e}")
 
+        if cached:
+            logger.warning(f"Using stale disk cache for {url}")
+            return cached["content"]
+
         return ""
 
+    def _disk_cache_path(self, url: str) -> Optional[Path]:
+        """Get the disk cache file for a URL, or None if disk caching is off."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_disk_cache(self, url: str) -> Optional[dict]:
+        """Read a cached entry for a URL from disk.
+
+        Args:
+            url: The URL the entry was stored for
+
+        Returns:
+            Dict with content and validators, or None if missing/corrupt
+        """
+        path = self._disk_cache_path(url)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable content cache {path}: {e}")
+            return None
+
+        content = entry.get("content")
+        if entry.get("url") != url or not isinstance(content, str):
+            return None
+        if entry.get("sha256") != hashlib.sha256(content.encode("utf-8")).hexdigest():
+            logger.warning(f"Content cache checksum mismatch for {url}, ignoring")
+            return None
+
+        return entry
+
+    def _write_disk_cache(self, url: str, response: httpx.Response) -> None:
+        """Persist a fetched response to the disk cache.
+
+        Args:
+            url: The URL that was fetched
+            response: The successful HTTP response
+        """
+        path = self._disk_cache_path(url)
+        if path is None:
+            return
+
+        content = response.text
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "sha256": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            "content": content,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write content cache for {url}: {e}")
+
     def get_cached_content(self, module_id: str) -> Dict[str, str]:
         """Get cached content for a module.
 
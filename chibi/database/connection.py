@@ -96,6 +96,8 @@ class Database:
         );
 
         -- Basic indexes (columns that always exist)
+        -- Case-insensitive username lookups (search_by_identifier, find_student)
+        CREATE INDEX IF NOT EXISTS idx_users_username_lower ON users(LOWER(username));
         CREATE INDEX IF NOT EXISTS idx_quiz_attempts_user ON quiz_attempts(user_id);
         CREATE INDEX IF NOT EXISTS idx_quiz_attempts_concept ON quiz_attempts(concept_id);
         CREATE INDEX IF NOT EXISTS idx_concept_mastery_user ON concept_mastery(user_id);
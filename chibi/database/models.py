@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents a Discord user in the database."""
 
@@ -18,7 +18,7 @@ class User:
     last_active: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuizAttempt:
     """Represents a quiz attempt."""
 
@@ -36,7 +36,7 @@ class QuizAttempt:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConceptMastery:
     """Represents a user's mastery of a concept."""
 
@@ -70,7 +70,7 @@ class ReviewStatus:
     REJECTED_STATUSES = {REJECTED_CONTENT_MISMATCH, REJECTED_HEAVY_MATH, REJECTED_DEADLINE_PASSED}
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMQuizAttempt:
     """Represents an LLM Quiz Challenge attempt where student tries to stump the AI."""
 
@@ -90,7 +90,7 @@ class LLMQuizAttempt:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceRecord:
     """Represents an attendance record in the database."""
 
@@ -1,14 +1,50 @@
 """Mastery repository for concept mastery database operations."""
 
-from typing import Dict, List
+import dataclasses
+import time
+from typing import Dict, List, Optional, Tuple
 
+from ...constants import REPOSITORY_CACHE_TTL
+from ..connection import Database
 from ..mappers import row_to_concept_mastery
 from ..models import ConceptMastery
 from .base import BaseRepository
 
 
 class MasteryRepository(BaseRepository):
-    """Repository for concept mastery operations."""
+    """Repository for concept mastery operations.
+
+    get_summary() and get_all_for_user() results are cached per user for
+    REPOSITORY_CACHE_TTL seconds and cleared whenever that user's mastery
+    rows are written. Each write also bumps a per-user version, which
+    callers can use to key their own caches of mastery-derived views.
+    """
+
+    def __init__(self, database: Database):
+        super().__init__(database)
+        # user_id -> (fetched_at, summary)
+        self._summary_cache: Dict[int, Tuple[float, Dict[str, int]]] = {}
+        # user_id -> (fetched_at, records)
+        self._records_cache: Dict[int, Tuple[float, List[ConceptMastery]]] = {}
+        # user_id -> number of mastery writes seen by this repository
+        self._versions: Dict[int, int] = {}
+
+    def _invalidate_user(self, user_id: int) -> None:
+        """Drop cached reads for a user after their mastery rows change."""
+        self._summary_cache.pop(user_id, None)
+        self._records_cache.pop(user_id, None)
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def get_version(self, user_id: int) -> int:
+        """Get a counter that changes whenever a user's mastery is written.
+
+        Args:
+            user_id: The user's database ID
+
+        Returns:
+            Version number; equal values mean no mastery writes in between
+        """
+        return self._versions.get(user_id, 0)
 
     async def get_or_create(self, user_id: int, concept_id: str) -> ConceptMastery:
         """Get or create concept mastery record."""
@@ -28,6 +64,7 @@ class MasteryRepository(BaseRepository):
             (user_id, concept_id),
         )
         await conn.commit()
+        self._invalidate_user(user_id)
 
         return ConceptMastery(
             id=cursor.lastrowid,
@@ -68,9 +105,20 @@ class MasteryRepository(BaseRepository):
             ),
         )
         await conn.commit()
+        self._invalidate_user(user_id)
 
     async def get_all_for_user(self, user_id: int) -> List[ConceptMastery]:
-        """Get all concept mastery records for a user."""
+        """Get all concept mastery records for a user.
+
+        Returns:
+            Copies of the records, so callers can't alter the cache
+        """
+        cached = self._records_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < REPOSITORY_CACHE_TTL:
+            return [dataclasses.replace(record) for record in cached[1]]
+
+        # A write during the query makes its rows stale; don't cache them then
+        version = self.get_version(user_id)
         conn = self.connection
         cursor = await conn.execute(
             "SELECT * FROM concept_mastery WHERE user_id = ? ORDER BY concept_id",
@@ -78,10 +126,19 @@ class MasteryRepository(BaseRepository):
         )
         rows = await cursor.fetchall()
 
-        return [row_to_concept_mastery(row) for row in rows]
+        records = [row_to_concept_mastery(row) for row in rows]
+        if self.get_version(user_id) == version:
+            self._records_cache[user_id] = (time.monotonic(), records)
+        return [dataclasses.replace(record) for record in records]
 
     async def get_summary(self, user_id: int) -> Dict[str, int]:
         """Get summary of user's mastery progress by level."""
+        cached = self._summary_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < REPOSITORY_CACHE_TTL:
+            return dict(cached[1])
+
+        # A write during the query makes its counts stale; don't cache them then
+        version = self.get_version(user_id)
         conn = self.connection
 
         # Get counts by mastery level
@@ -104,14 +161,37 @@ class MasteryRepository(BaseRepository):
             if row["mastery_level"] in summary:
                 summary[row["mastery_level"]] = row["count"]
 
-        return summary
+        if self.get_version(user_id) == version:
+            self._summary_cache[user_id] = (time.monotonic(), summary)
+        return dict(summary)
+
+    async def get_all(
+        self, concept_ids: Optional[List[str]] = None
+    ) -> List[ConceptMastery]:
+        """Get all concept mastery records for all users.
+
+        Args:
+            concept_ids: If given, only fetch records for these concepts
+
+        Returns:
+            List of ConceptMastery records ordered by user and concept
+        """
+        if concept_ids == []:
+            return []
 
-    async def get_all(self) -> List[ConceptMastery]:
-        """Get all concept mastery records for all users."""
         conn = self.connection
-        cursor = await conn.execute(
-            "SELECT * FROM concept_mastery ORDER BY user_id, concept_id"
-        )
+        if concept_ids is None:
+            cursor = await conn.execute(
+                "SELECT * FROM concept_mastery ORDER BY user_id, concept_id"
+            )
+        else:
+            placeholders = ",".join("?" * len(concept_ids))
+            cursor = await conn.execute(
+                f"""SELECT * FROM concept_mastery
+                   WHERE concept_id IN ({placeholders})
+                   ORDER BY user_id, concept_id""",
+                list(concept_ids),
+            )
         rows = await cursor.fetchall()
 
         return [row_to_concept_mastery(row) for row in rows]
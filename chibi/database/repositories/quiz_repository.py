@@ -1,7 +1,7 @@
 """Quiz repository for quiz attempt database operations."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..mappers import row_to_quiz_attempt
 from ..models import QuizAttempt
@@ -110,6 +110,24 @@ class QuizRepository(BaseRepository):
         row = await cursor.fetchone()
         return row["correct"] if row else 0
 
+    async def get_attempt_counts(self, user_id: int) -> Tuple[int, int]:
+        """Get total and correct quiz attempts for a user in one query.
+
+        Args:
+            user_id: The user's database ID
+
+        Returns:
+            Tuple of (total attempts, correct attempts)
+        """
+        conn = self.connection
+        cursor = await conn.execute(
+            """SELECT COUNT(*) as total, COALESCE(SUM(is_correct = 1), 0) as correct
+               FROM quiz_attempts WHERE user_id = ?""",
+            (user_id,),
+        )
+        row = await cursor.fetchone()
+        return (row["total"], row["correct"]) if row else (0, 0)
+
     async def get_user_attempts(
         self, user_id: int, limit: int = 10
     ) -> List[QuizAttempt]:
@@ -3,7 +3,7 @@
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import chromadb
 from chromadb.config import Settings
@@ -13,6 +13,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# HNSW parameters sized for course-scale collections (well under 100k vectors):
+# modest graph degree and construction effort keep inserts cheap, while
+# search_ef stays high enough for near-exact recall at low query latency.
+# These only take effect when the collection is first created.
+DEFAULT_COLLECTION_METADATA: Dict[str, Any] = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": 64,
+}
+
 
 @dataclass
 class SimilarQuestion:
@@ -30,8 +41,13 @@ class SimilarityRepository:
 
     COLLECTION_NAME = "llm_quiz_questions"
 
-    def __init__(self, config: "SimilarityConfig"):
+    def __init__(
+        self,
+        config: "SimilarityConfig",
+        collection_metadata: Optional[Dict[str, Any]] = None,
+    ):
         self.config = config
+        self.collection_metadata = collection_metadata or DEFAULT_COLLECTION_METADATA
         self._client: Optional[chromadb.PersistentClient] = None
         self._collection: Optional[chromadb.Collection] = None
 
@@ -49,12 +65,24 @@ class SimilarityRepository:
 
         self._collection = self._client.get_or_create_collection(
             name=self.COLLECTION_NAME,
-            metadata={"hnsw:space": "cosine"},
+            metadata=self.collection_metadata,
         )
 
-        logger.info(
-            f"ChromaDB connected, collection has {self._collection.count()} questions"
-        )
+        count = self._collection.count()
+        logger.info(f"ChromaDB connected, collection has {count} questions")
+
+        if count:
+            self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Run one throwaway query so the HNSW index is loaded before first use."""
+        try:
+            sample = self._collection.get(limit=1, include=["embeddings"])
+            embeddings = sample.get("embeddings")
+            if embeddings is not None and len(embeddings) > 0:
+                self._collection.query(query_embeddings=[list(embeddings[0])], n_results=1)
+        except Exception as e:
+            logger.debug(f"Similarity index warm-up skipped: {e}")
 
     async def close(self) -> None:
         """Close ChromaDB connection."""
@@ -1,9 +1,13 @@
 """User repository for user-related database operations."""
 
+import dataclasses
 import logging
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from ...constants import REPOSITORY_CACHE_TTL
+from ..connection import Database
 from ..mappers import row_to_user
 from ..models import User
 from .base import BaseRepository
@@ -12,7 +16,24 @@ logger = logging.getLogger(__name__)
 
 
 class UserRepository(BaseRepository):
-    """Repository for user operations."""
+    """Repository for user operations.
+
+    get_all() results are cached for REPOSITORY_CACHE_TTL seconds. Writes
+    that add users or change their names or registration clear the cache;
+    last_active timestamps may lag by up to the TTL.
+    """
+
+    def __init__(self, database: Database):
+        super().__init__(database)
+        # (fetched_at, users) from the last get_all() call
+        self._all_users_cache: Optional[Tuple[float, List[User]]] = None
+        # Bumped on every invalidation, so a read that raced a write can tell
+        self._cache_generation = 0
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached get_all() result."""
+        self._all_users_cache = None
+        self._cache_generation += 1
 
     async def get_or_create(self, discord_id: str, username: str) -> User:
         """Get existing user or create new one."""
@@ -31,6 +52,8 @@ class UserRepository(BaseRepository):
                 (username, discord_id),
             )
             await conn.commit()
+            if row["username"] != username:
+                self.invalidate_cache()
             return User(
                 id=row["id"],
                 discord_id=row["discord_id"],
@@ -45,6 +68,7 @@ class UserRepository(BaseRepository):
             (discord_id, username),
         )
         await conn.commit()
+        self.invalidate_cache()
 
         return User(
             id=cursor.lastrowid,
@@ -68,12 +92,47 @@ class UserRepository(BaseRepository):
         return row_to_user(row)
 
     async def get_all(self) -> List[User]:
-        """Get all users in the database."""
+        """Get all users in the database.
+
+        Returns:
+            Copies of the user records, so callers can't alter the cache
+        """
+        cached = self._all_users_cache
+        if cached is not None and time.monotonic() - cached[0] < REPOSITORY_CACHE_TTL:
+            return [dataclasses.replace(user) for user in cached[1]]
+
+        # A write during the query makes its rows stale; don't cache them then
+        generation = self._cache_generation
         conn = self.connection
         cursor = await conn.execute("SELECT * FROM users ORDER BY username")
         rows = await cursor.fetchall()
 
-        return [row_to_user(row) for row in rows]
+        users = [row_to_user(row) for row in rows]
+        if self._cache_generation == generation:
+            self._all_users_cache = (time.monotonic(), users)
+        return [dataclasses.replace(user) for user in users]
+
+    async def get_activity_list(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Get every user's Discord ID, username and last active date.
+
+        A lighter projection than get_all() for listings: only three columns
+        are read and SQLite formats the date, so no User objects or datetimes
+        are built.
+
+        Returns:
+            List of (discord_id, username, "YYYY-MM-DD" or None) ordered by username
+        """
+        conn = self.connection
+        cursor = await conn.execute(
+            """SELECT discord_id, username, date(last_active) AS last_active_date
+               FROM users ORDER BY username"""
+        )
+        rows = await cursor.fetchall()
+
+        return [
+            (row["discord_id"], row["username"], row["last_active_date"])
+            for row in rows
+        ]
 
     async def search_by_identifier(self, identifier: str) -> Optional[User]:
         """Search for a user by Discord ID, username, or partial match.
@@ -144,6 +203,7 @@ class UserRepository(BaseRepository):
             (student_id, student_name, discord_id),
         )
         await conn.commit()
+        self.invalidate_cache()
         return True
 
     async def get_student_info(self, discord_id: str) -> Optional[dict]:
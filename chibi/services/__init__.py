@@ -11,6 +11,7 @@ from .llm_quiz_service import LLMQuizChallengeResult, LLMQuizChallengeService
 from .pending_quiz_manager import PendingQuiz, PendingQuizManager
 from .quiz_service import EvaluationResult, QuizService
 from .rag_service import RAGResult, RAGService
+from .response_cache import ResponseCache
 from .search_agent import SearchAgentService, SearchContextType, SearchResult
 from .similarity_service import SimilarityCheckResult, SimilarityService
 
@@ -30,6 +31,7 @@ __all__ = [
     "QuizService",
     "RAGResult",
     "RAGService",
+    "ResponseCache",
     "SearchAgentService",
     "SearchContextType",
     "SearchResult",
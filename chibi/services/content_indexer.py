@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from ..database.repositories.rag_repository import RAGRepository
     from .contextual_chunking_service import ContextualChunkingService
     from .embedding_service import EmbeddingService
+    from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ class ContentIndexer:
         batch_size: int = 10,
         contextual_chunking_service: Optional["ContextualChunkingService"] = None,
         use_contextual_retrieval: bool = False,
+        response_cache: Optional["ResponseCache"] = None,
     ):
         """Initialize the content indexer.
 
@@ -42,6 +44,8 @@ class ContentIndexer:
             batch_size: Number of chunks to process in each batch
             contextual_chunking_service: Optional service for contextual chunking
             use_contextual_retrieval: Whether to use contextual retrieval
+            response_cache: Optional agent reply cache, cleared whenever a
+                module is re-indexed so stale answers don't outlive content
         """
         self.embedding_service = embedding_service
         self.rag_repo = rag_repo
@@ -52,6 +56,7 @@ class ContentIndexer:
         self.batch_size = batch_size
         self.contextual_service = contextual_chunking_service
         self.use_contextual_retrieval = use_contextual_retrieval
+        self.response_cache = response_cache
 
     async def index_course(
         self,
@@ -186,6 +191,10 @@ class ContentIndexer:
         else:
             logger.debug(f"Module {module.id} has no content to index")
 
+        # Cached replies may quote the content that was just replaced
+        if self.response_cache:
+            self.response_cache.clear()
+
         return result
 
     async def _has_module_sources(self, module_id: str) -> bool:
@@ -258,8 +267,10 @@ class ContentIndexer:
                 else chunk.text
             )
 
-            # Generate embedding
-            embedding = await self.embedding_service.get_embedding(text_for_embedding)
+            # Generate embedding; chunks are embedded once, so skip the cache
+            embedding = await self.embedding_service.get_embedding(
+                text_for_embedding, use_cache=False
+            )
             if embedding is None:
                 logger.warning(f"Failed to generate embedding for chunk {chunk.chunk_id}")
                 continue
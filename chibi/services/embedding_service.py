@@ -1,11 +1,15 @@
 """Embedding service with Ollama primary and OpenRouter fallback."""
 
 import logging
+from array import array
+from collections import OrderedDict
 from typing import List, Optional, TYPE_CHECKING
 
 import httpx
 from ollama import AsyncClient
 
+from ..constants import EMBEDDING_CACHE_SIZE
+
 if TYPE_CHECKING:
     from ..config import SimilarityConfig
 
@@ -13,13 +17,25 @@ logger = logging.getLogger(__name__)
 
 
 class EmbeddingService:
-    """Service for generating embeddings using Ollama with OpenRouter fallback."""
-
-    def __init__(self, config: "SimilarityConfig", api_key: str = ""):
+    """Service for generating embeddings using Ollama with OpenRouter fallback.
+
+    Embeddings are kept in an in-memory LRU keyed by text, so repeated
+    questions skip the model call.
+    """
+
+    def __init__(
+        self,
+        config: "SimilarityConfig",
+        api_key: str = "",
+        cache_size: int = EMBEDDING_CACHE_SIZE,
+    ):
         self.config = config
         self.api_key = api_key
         self._ollama_client = AsyncClient(host=config.ollama_base_url)
         self._http_client: Optional[httpx.AsyncClient] = None
+        # Key: text, Value: embedding packed as doubles (successes only)
+        self._cache: "OrderedDict[str, array]" = OrderedDict()
+        self._cache_size = cache_size
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client for OpenRouter."""
@@ -65,17 +81,39 @@ class EmbeddingService:
             logger.warning(f"OpenRouter embedding failed: {e}")
             return None
 
-    async def get_embedding(self, text: str) -> Optional[List[float]]:
+    async def get_embedding(
+        self, text: str, use_cache: bool = True
+    ) -> Optional[List[float]]:
         """Generate embedding for a single text.
 
         Tries Ollama first, falls back to OpenRouter if configured.
+        Recently embedded texts are served from the in-memory cache.
 
         Args:
             text: The text to embed
+            use_cache: Whether to read and fill the cache; bulk one-off
+                embedding (e.g. content indexing) should pass False
 
         Returns:
             List of floats representing the embedding, or None on error
         """
+        if not use_cache:
+            return await self._embed_uncached(text)
+
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached.tolist()
+
+        embedding = await self._embed_uncached(text)
+        if embedding is not None:
+            self._cache[text] = array("d", embedding)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return embedding
+
+    async def _embed_uncached(self, text: str) -> Optional[List[float]]:
+        """Generate an embedding from the providers, bypassing the cache."""
         # Try Ollama first
         embedding = await self._get_ollama_embedding(text)
         if embedding is not None:
@@ -1,15 +1,83 @@
 """Grade service for generating grade reports."""
 
-import csv
+import asyncio
 import io
-from typing import Optional, TYPE_CHECKING
+import re
+import shutil
+import tempfile
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple, TYPE_CHECKING
 
-from ..constants import MASTERY_MASTERED, MASTERY_PROFICIENT
+from ..constants import GRADE_CSV_SPOOL_MAX_SIZE, MASTERY_COMPLETED_LEVELS
 
 if TYPE_CHECKING:
     from ..content.course import Course, Module
+    from ..database.models import ConceptMastery, User
     from ..database.repositories import MasteryRepository, UserRepository
 
+# Characters that force a CSV field to be quoted (same rule as csv.QUOTE_MINIMAL)
+_NEEDS_QUOTING = re.compile(r'[",\r\n]').search
+
+
+def _format_csv_row(row: List[str]) -> str:
+    """Format one CSV row, quoting only the fields that need it.
+
+    The grade report has a fixed four-column schema where quoting is rare
+    (usernames with commas or quotes), so this skips csv.writer's per-cell
+    dialect handling while producing identical output.
+
+    Args:
+        row: Field values for the row
+
+    Returns:
+        The formatted row including the trailing CRLF
+    """
+    return ",".join(
+        '"' + value.replace('"', '""') + '"' if _NEEDS_QUOTING(value) else value
+        for value in row
+    ) + "\r\n"
+
+
+def _completion_pct_strings(concept_count: int) -> Tuple[str, ...]:
+    """Precompute formatted completion percentages for a module.
+
+    A module with n concepts can only produce n + 1 distinct percentages,
+    so they are formatted once per report instead of once per student.
+
+    Args:
+        concept_count: Number of concepts in the module
+
+    Returns:
+        Tuple where index k is the percentage string for k completed concepts
+    """
+    if not concept_count:
+        return ("0.0",)
+    return tuple(
+        f"{completed / concept_count * 100:.1f}"
+        for completed in range(concept_count + 1)
+    )
+
+
+@dataclass
+class GradeReportData:
+    """Everything needed to format a grade report, fetched up front.
+
+    Concepts are laid out in one dense slot range, module by module, so a
+    module's completed count is a sum over a contiguous slice.
+    """
+
+    users: List["User"]
+    # (module_id, start_slot, end_slot, pct_strings) for each module, where
+    # pct_strings[n] is the formatted completion for n completed concepts
+    modules: List[Tuple[str, int, int, Tuple[str, ...]]]
+    # concept_id -> slots it occupies (more than one if shared by modules)
+    concept_slots: Dict[str, List[int]]
+    slot_count: int
+    # user_id -> ids of concepts the user has completed
+    completed_by_user: Dict[int, List[str]]
+
 
 class GradeService:
     """Service for grade calculations and CSV generation."""
@@ -35,47 +103,187 @@ class GradeService:
         Returns:
             CSV content as a string (one row per user-module combination)
         """
-        users = await self.user_repo.get_all()
+        data = await self._fetch_grade_data(target_module)
+        output = io.StringIO()
+        await asyncio.to_thread(self._write_grade_csv, output, data)
+        return output.getvalue()
 
+    async def generate_grade_csv_file(
+        self, target_module: Optional["Module"] = None
+    ) -> BinaryIO:
+        """Generate the grade CSV as a UTF-8 encoded file object.
+
+        Rows are encoded straight into a spooled temporary file, so the
+        report is never held as a str and then copied again by encoding it.
+        Reports over GRADE_CSV_SPOOL_MAX_SIZE spill to disk instead of memory.
+
+        Args:
+            target_module: If specified, only include data for this module
+
+        Returns:
+            Binary file positioned at the start, ready for discord.File
+        """
+        data = await self._fetch_grade_data(target_module)
+        return await asyncio.to_thread(self._format_grade_csv_file, data)
+
+    async def compress_grade_csv_file(
+        self, csv_file: BinaryIO, arcname: str
+    ) -> BinaryIO:
+        """Zip a generated grade CSV file for upload.
+
+        Args:
+            csv_file: Binary CSV file from generate_grade_csv_file
+            arcname: Name of the CSV entry inside the archive
+
+        Returns:
+            Binary zip file positioned at the start
+        """
+        return await asyncio.to_thread(self._zip_grade_csv_file, csv_file, arcname)
+
+    async def _fetch_grade_data(
+        self, target_module: Optional["Module"] = None
+    ) -> GradeReportData:
+        """Load users and mastery for a grade report.
+
+        Args:
+            target_module: If specified, only include data for this module
+
+        Returns:
+            GradeReportData ready for formatting
+        """
         if target_module:
             modules = [target_module]
         else:
             modules = self.course.modules
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["discord_id", "username", "module", "completion_pct"])
-
-        for user in users:
-            mastery_records = await self.mastery_repo.get_all_for_user(user.id)
-            mastery_by_concept = {m.concept_id: m for m in mastery_records}
-
-            for mod in modules:
-                module_concepts = mod.concepts
-
-                # Count completed concepts (proficient or mastered)
-                completed_count = sum(
-                    1
-                    for concept in module_concepts
-                    if mastery_by_concept.get(concept.id)
-                    and mastery_by_concept[concept.id].mastery_level
-                    in (MASTERY_PROFICIENT, MASTERY_MASTERED)
-                )
+        # Give every concept a dense slot so counting works on flat arrays
+        module_ranges = []
+        concept_slots: Dict[str, List[int]] = defaultdict(list)
+        slot = 0
+        for mod in modules:
+            start = slot
+            for concept_id in mod.concept_ids:
+                concept_slots[concept_id].append(slot)
+                slot += 1
+            module_ranges.append(
+                (mod.id, start, slot, _completion_pct_strings(slot - start))
+            )
 
-                # Calculate completion percentage
-                completion_pct = (
-                    (completed_count / len(module_concepts) * 100)
-                    if module_concepts
-                    else 0
+        # The report covers every user, so mastery doesn't need filtering by
+        # user id and both queries can run at once. A single-module report
+        # only needs that module's concepts.
+        async with asyncio.TaskGroup() as tg:
+            users_task = tg.create_task(self.user_repo.get_all())
+            mastery_task = tg.create_task(
+                self.mastery_repo.get_all(
+                    concept_ids=list(concept_slots) if target_module else None
                 )
+            )
+        users = users_task.result()
+        mastery_records = mastery_task.result()
 
-                writer.writerow(
-                    [
-                        user.discord_id,
-                        user.username,
-                        mod.id,
-                        f"{completion_pct:.1f}",
-                    ]
-                )
+        completed_by_user: Dict[int, List[str]] = defaultdict(list)
+        for mastery in mastery_records:
+            if mastery.mastery_level in MASTERY_COMPLETED_LEVELS:
+                completed_by_user[mastery.user_id].append(mastery.concept_id)
 
-        return output.getvalue()
+        return GradeReportData(
+            users=users,
+            modules=module_ranges,
+            concept_slots=concept_slots,
+            slot_count=slot,
+            completed_by_user=completed_by_user,
+        )
+
+    def _format_grade_csv_file(self, data: GradeReportData) -> BinaryIO:
+        """Encode a grade report into a spooled file (runs in a worker thread).
+
+        Args:
+            data: Fetched grade report data
+
+        Returns:
+            Binary file positioned at the start
+        """
+        buffer = tempfile.SpooledTemporaryFile(
+            max_size=GRADE_CSV_SPOOL_MAX_SIZE, mode="w+b"
+        )
+        text = io.TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
+        self._write_grade_csv(text, data)
+        text.flush()
+        # Detach so the wrapper doesn't close the buffer when collected
+        text.detach()
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def _zip_grade_csv_file(csv_file: BinaryIO, arcname: str) -> BinaryIO:
+        """Copy a CSV file into a deflated zip archive (runs in a worker thread).
+
+        Args:
+            csv_file: Binary CSV file to compress
+            arcname: Name of the CSV entry inside the archive
+
+        Returns:
+            Binary zip file positioned at the start
+        """
+        buffer = tempfile.SpooledTemporaryFile(
+            max_size=GRADE_CSV_SPOOL_MAX_SIZE, mode="w+b"
+        )
+        csv_file.seek(0)
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(arcname, "w") as entry:
+                shutil.copyfileobj(csv_file, entry)
+        buffer.seek(0)
+        return buffer
+
+    def _write_grade_csv(self, output: TextIO, data: GradeReportData) -> None:
+        """Write grade rows in tidy format to a text stream.
+
+        Args:
+            output: Text stream to write CSV rows to
+            data: Fetched grade report data
+        """
+        # writelines over a lazy map keeps the loop in C without building
+        # the full row list
+        output.writelines(map(_format_csv_row, self._iter_grade_rows(data)))
+
+    def _iter_grade_rows(self, data: GradeReportData) -> Iterator[List[str]]:
+        """Yield the grade report header followed by one row per user-module.
+
+        Rows are produced one at a time so writers can stream them out
+        instead of holding every user-module row in memory.
+
+        Args:
+            data: Fetched grade report data
+
+        Yields:
+            CSV rows as lists of strings
+        """
+        yield ["discord_id", "username", "module", "completion_pct"]
+
+        modules = data.modules
+        slots_get = data.concept_slots.get
+        for user in data.users:
+            completed_ids = data.completed_by_user.get(user.id)
+
+            # Students with nothing completed have nothing to count
+            if not completed_ids:
+                for module_id, _, _, pct_strings in modules:
+                    yield [user.discord_id, user.username, module_id, pct_strings[0]]
+                continue
+
+            # Mark completed concepts (proficient or mastered) by slot
+            completed = bytearray(data.slot_count)
+            for concept_id in completed_ids:
+                for slot in slots_get(concept_id, ()):
+                    completed[slot] = 1
+
+            for module_id, start, end, pct_strings in modules:
+                yield [
+                    user.discord_id,
+                    user.username,
+                    module_id,
+                    pct_strings[sum(completed[start:end])],
+                ]
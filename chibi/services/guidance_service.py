@@ -5,9 +5,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from ..constants import (
-    MASTERY_MASTERED,
+    MASTERY_COMPLETED_LEVELS,
     MASTERY_NOVICE,
-    MASTERY_PROFICIENT,
     MASTERY_LEARNING,
     MASTERY_RATIO_MASTERED,
     MASTERY_RATIO_PROFICIENT,
@@ -243,7 +242,7 @@ class GuidanceService:
         accuracy = correct_attempts / total_attempts if total_attempts > 0 else 0.0
         quality = mastery.avg_quality_score or 0.0
 
-        is_complete = current_level in (MASTERY_PROFICIENT, MASTERY_MASTERED)
+        is_complete = current_level in MASTERY_COMPLETED_LEVELS
 
         if is_complete:
             return ConceptGuidance(
@@ -6,7 +6,13 @@ import re
 from dataclasses import dataclass
 from typing import Optional, Tuple, TYPE_CHECKING
 
-from ..constants import TEMPERATURE_EVALUATION, TEMPERATURE_QUIZ_GENERATION
+from ..constants import (
+    MASTERY_LEARNING,
+    MASTERY_NOVICE,
+    MASTERY_PROFICIENT,
+    TEMPERATURE_EVALUATION,
+    TEMPERATURE_QUIZ_GENERATION,
+)
 from ..learning.mastery import MasteryCalculator
 from ..prompts.templates import PromptTemplates
 
@@ -17,6 +23,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Quiz priority (lower = quizzed sooner) and reason per mastery level;
+# mastered and unknown levels fall back to review
+SELECTION_PRIORITY = {
+    MASTERY_NOVICE: (1, "Needs practice"),
+    MASTERY_LEARNING: (2, "Building understanding"),
+    MASTERY_PROFICIENT: (3, "Reinforcement"),
+}
+SELECTION_PRIORITY_REVIEW = (4, "Review")
+
 
 @dataclass
 class EvaluationResult:
@@ -70,20 +85,11 @@ class QuizService:
 
             # Calculate priority score (lower = higher priority for quizzing)
             if mastery.total_attempts == 0:
-                score = 0  # Highest priority: never attempted
-                reason = "New concept"
-            elif mastery.mastery_level == "novice":
-                score = 1
-                reason = "Needs practice"
-            elif mastery.mastery_level == "learning":
-                score = 2
-                reason = "Building understanding"
-            elif mastery.mastery_level == "proficient":
-                score = 3
-                reason = "Reinforcement"
-            else:  # mastered
-                score = 4
-                reason = "Review"
+                score, reason = 0, "New concept"  # Highest priority: never attempted
+            else:
+                score, reason = SELECTION_PRIORITY.get(
+                    mastery.mastery_level, SELECTION_PRIORITY_REVIEW
+                )
 
             concept_scores.append((concept, score, mastery.total_attempts, reason))
 
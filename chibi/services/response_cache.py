@@ -0,0 +1,146 @@
+"""Semantic response cache for natural language agent replies."""
+
+import logging
+import math
+import operator
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """LRU cache of agent replies keyed by message embedding similarity.
+
+    FAQ-style course questions repeat a lot across students. A lookup embeds
+    the normalized message and returns the reply stored for the most similar
+    earlier message when their cosine similarity clears the threshold, which
+    skips the whole agent graph (and its LLM round-trips) on a hit.
+    """
+
+    def __init__(
+        self,
+        embedding_service: "EmbeddingService",
+        similarity_threshold: float = 0.95,
+        max_entries: int = 256,
+        min_message_length: int = 20,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            embedding_service: Service used to embed messages
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached replies (LRU eviction)
+            min_message_length: Shorter messages are never cached, since
+                replies to "yes" or "tell me more" depend on the conversation.
+                Messages sent with prior history are never cached either
+        """
+        self.embedding_service = embedding_service
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.min_message_length = min_message_length
+        # Key: normalized message, Value: (unit-length embedding, reply)
+        self._entries: "OrderedDict[str, Tuple[List[float], str]]" = OrderedDict()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize a message for cache keying (case and whitespace)."""
+        return " ".join(text.lower().split())
+
+    def is_cacheable(self, text: str, has_history: bool = False) -> bool:
+        """Check whether a message can be served from or stored in the cache.
+
+        Replies are shared across students, so only the opening message of a
+        conversation qualifies: a follow-up like "Can you explain that in more
+        detail please?" is answered from history the next student doesn't have.
+
+        Args:
+            text: The raw message text
+            has_history: Whether the user already has conversation history
+                in this channel
+
+        Returns:
+            True if the message is standalone and long enough to cache
+        """
+        if has_history:
+            return False
+        return len(self.normalize(text)) >= self.min_message_length
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embed a normalized message as a unit-length vector.
+
+        Args:
+            text: The raw message text
+
+        Returns:
+            Unit-length embedding, or None if embedding failed
+        """
+        embedding = await self.embedding_service.get_embedding(self.normalize(text))
+        if not embedding:
+            return None
+
+        norm = math.sqrt(sum(x * x for x in embedding))
+        if norm == 0:
+            return None
+        return [x / norm for x in embedding]
+
+    def lookup(self, text: str, embedding: Optional[List[float]]) -> Optional[str]:
+        """Find a cached reply for a message.
+
+        Args:
+            text: The raw message text
+            embedding: Unit-length embedding from embed(), if available
+
+        Returns:
+            The cached reply on a hit, None otherwise
+        """
+        key = self.normalize(text)
+
+        # Exact repeat: no similarity scan needed
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        if embedding is None:
+            return None
+
+        best_key = None
+        best_score = self.similarity_threshold
+        for cached_key, (cached_embedding, _) in self._entries.items():
+            if len(cached_embedding) != len(embedding):
+                continue
+            score = sum(map(operator.mul, embedding, cached_embedding))
+            if score >= best_score:
+                best_key, best_score = cached_key, score
+
+        if best_key is None:
+            return None
+
+        logger.debug(f"Response cache hit (similarity={best_score:.3f})")
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def store(self, text: str, embedding: List[float], reply: str) -> None:
+        """Store a reply for a message, evicting the least recently used entry.
+
+        Args:
+            text: The raw message text
+            embedding: Unit-length embedding from embed()
+            reply: The reply that was sent for this message
+        """
+        key = self.normalize(text)
+        self._entries[key] = (embedding, reply)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached replies."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
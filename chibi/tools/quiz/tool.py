@@ -1,5 +1,6 @@
 """Quiz tool implementation."""
 
+import asyncio
 import logging
 import random
 from typing import TYPE_CHECKING, Any, Optional
@@ -89,15 +90,18 @@ class QuizAnswerModal(discord.ui.Modal, title="Quiz"):
                 )
                 return
 
-            # Log attempt and update mastery
-            await self.tool.bot.quiz_service.log_attempt_and_update_mastery(
-                user_id=self.db_user_id,
-                module_id=self.module_id,
-                concept_id=self.concept_id,
-                question=self.question,
-                user_answer=student_answer,
-                correct_answer=self.correct_answer,
-                result=result,
+            # Log attempt and update mastery while the feedback is sent, so
+            # the student isn't kept waiting on the writes
+            record_task = asyncio.create_task(
+                self.tool.bot.quiz_service.log_attempt_and_update_mastery(
+                    user_id=self.db_user_id,
+                    module_id=self.module_id,
+                    concept_id=self.concept_id,
+                    question=self.question,
+                    user_answer=student_answer,
+                    correct_answer=self.correct_answer,
+                    result=result,
+                )
             )
 
             # Send feedback
@@ -109,7 +113,15 @@ class QuizAnswerModal(discord.ui.Modal, title="Quiz"):
                 concept_name=self.concept_name,
             )
 
-            await interaction.followup.send(embed=embed)
+            try:
+                await interaction.followup.send(embed=embed)
+            finally:
+                # Record the attempt even if sending failed; a failed write
+                # must not turn feedback already shown into an error
+                try:
+                    await record_task
+                except Exception as e:
+                    logger.error(f"Failed to record quiz attempt: {e}", exc_info=True)
 
             # Log the feedback to conversation memory
             status = "PASS" if result.is_correct else ("PARTIAL" if result.is_partial else "FAIL")
@@ -1,13 +1,14 @@
 """Status tool implementation."""
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 import discord
 
 from ...agent.state import SubAgentState, ToolResult
-from ...constants import ERROR_MODULE_NOT_FOUND
-from ...ui import create_progress_bar, get_mastery_emoji
+from ...constants import DISCORD_EMBED_FIELD_LIMIT, ERROR_MODULE_NOT_FOUND
+from ...ui import create_progress_bar, get_mastery_emoji, join_lines
 from ..base import BaseTool, ToolConfig
 
 if TYPE_CHECKING:
@@ -99,8 +100,20 @@ class StatusTool(BaseTool):
         self, user_id: int, user_name: str
     ) -> discord.Embed:
         """Build summary status embed."""
+        # The reads below are independent, so issue them together
+        async with asyncio.TaskGroup() as tg:
+            mastery_task = tg.create_task(
+                self.bot.mastery_repo.get_all_for_user(user_id)
+            )
+            counts_task = tg.create_task(
+                self.bot.quiz_repo.get_attempt_counts(user_id)
+            )
+            llm_quiz_task = tg.create_task(
+                self.bot.llm_quiz_service.get_all_progress(user_id)
+            )
+
         # Get mastery records and config
-        mastery_records = await self.bot.mastery_repo.get_all_for_user(user_id)
+        mastery_records = mastery_task.result()
         mastery_by_concept = {m.concept_id: m for m in mastery_records}
         min_attempts = self.bot.config.mastery.min_attempts_for_mastery
 
@@ -110,8 +123,7 @@ class StatusTool(BaseTool):
         )
 
         # Quiz stats (fetched from quiz_attempts table)
-        total_quizzes = await self.bot.quiz_repo.count_for_user(user_id)
-        correct = await self.bot.quiz_repo.count_correct_for_user(user_id)
+        total_quizzes, correct = counts_task.result()
         accuracy = correct / total_quizzes * 100 if total_quizzes > 0 else 0
 
         embed.add_field(
@@ -122,7 +134,7 @@ class StatusTool(BaseTool):
 
         # Calculate overall passed/required
         total_passed = 0
-        total_required = 0
+        total_required = self.bot.course.total_concept_count * min_attempts
 
         # Module progress bars
         module_lines = []
@@ -137,7 +149,6 @@ class StatusTool(BaseTool):
                     module_passed += min(mastery.correct_attempts, min_attempts)
 
             total_passed += module_passed
-            total_required += module_required
 
             # Create progress bar for this module
             progress_bar = create_progress_bar(module_passed, module_required)
@@ -159,7 +170,7 @@ class StatusTool(BaseTool):
         )
 
         # LLM Quiz Challenge progress
-        llm_quiz_progress = await self.bot.llm_quiz_service.get_all_progress(user_id)
+        llm_quiz_progress = llm_quiz_task.result()
         if llm_quiz_progress:
             progress_lines = []
             for module_id, (wins, target) in llm_quiz_progress.items():
@@ -194,8 +205,10 @@ class StatusTool(BaseTool):
             color=discord.Color.blue(),
         )
 
-        # Get mastery records and config
-        mastery_records = await self.bot.mastery_repo.get_all_for_user(user_id)
+        # Fetch mastery only for this module's concepts
+        mastery_records = await self.bot.mastery_repo.get_by_concepts(
+            user_id, list(module.concept_ids)
+        )
         mastery_by_concept = {m.concept_id: m for m in mastery_records}
         min_attempts = self.bot.config.mastery.min_attempts_for_mastery
 
@@ -232,7 +245,7 @@ class StatusTool(BaseTool):
         if concept_lines:
             embed.add_field(
                 name="Concepts",
-                value="\n".join(concept_lines),
+                value=join_lines(concept_lines, DISCORD_EMBED_FIELD_LIMIT),
                 inline=False,
             )
 
@@ -1,16 +1,20 @@
 """UI utilities for Discord embeds and formatting."""
 
 from .formatters import (
+    chunk_lines,
     create_progress_bar,
     get_mastery_emoji,
+    join_lines,
     truncate_text,
 )
 from .embeds import QuizEmbedBuilder, StatusEmbedBuilder
 from .views import AdminReviewView, ReviewOption
 
 __all__ = [
+    "chunk_lines",
     "create_progress_bar",
     "get_mastery_emoji",
+    "join_lines",
     "truncate_text",
     "QuizEmbedBuilder",
     "StatusEmbedBuilder",
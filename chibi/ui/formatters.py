@@ -1,14 +1,21 @@
 """Shared formatting utilities for Discord embeds."""
 
+import functools
+from typing import List
+
 from ..constants import MASTERY_EMOJI, PROGRESS_BAR_LENGTH
 
 
+@functools.lru_cache(maxsize=4096)
 def create_progress_bar(
     passed: int,
     required: int,
 ) -> str:
     """Create a visual progress bar showing passed quizzes vs required.
 
+    Results are memoized: inputs are small counts that repeat across a
+    class, so status views mostly reuse already-built bars.
+
     Args:
         passed: Number of correct quiz answers (will be capped at required)
         required: Total number of correct answers needed
@@ -22,12 +29,11 @@ def create_progress_bar(
     # Cap passed at required
     capped_passed = min(passed, required)
 
-    # Calculate filled length
-    filled_len = int(capped_passed / required * PROGRESS_BAR_LENGTH)
+    # Integer math avoids float rounding; the empty part takes the remainder
+    filled_len = capped_passed * PROGRESS_BAR_LENGTH // required
     empty_len = PROGRESS_BAR_LENGTH - filled_len
 
-    bar = "[" + "█" * filled_len + "░" * empty_len + "]"
-    return f"{bar} {capped_passed}/{required}"
+    return f"[{'█' * filled_len}{'░' * empty_len}] {capped_passed}/{required}"
 
 
 def get_mastery_emoji(level: str) -> str:
@@ -56,3 +62,55 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if not text or len(text) <= max_length:
         return text or ""
     return text[: max_length - len(suffix)] + suffix
+
+
+def join_lines(lines: List[str], max_length: int) -> str:
+    """Join lines with newlines, eliding the tail to stay within a limit.
+
+    Args:
+        lines: Lines to join
+        max_length: Maximum length of the joined string (e.g. an embed field)
+
+    Returns:
+        Newline-joined lines, ending with "...and N more" if any were dropped
+    """
+    joined = "\n".join(lines)
+    if len(joined) <= max_length:
+        return joined
+
+    kept = []
+    length = 0
+    for index, line in enumerate(lines):
+        # Reserve room for the "...and N more" line that replaces the rest
+        overflow = f"...and {len(lines) - index} more"
+        if length + len(line) + len(overflow) + 2 > max_length:
+            kept.append(overflow)
+            break
+        kept.append(line)
+        length += len(line) + 1
+    return "\n".join(kept)
+
+
+def chunk_lines(lines: List[str], max_length: int) -> List[str]:
+    """Group lines into newline-joined chunks that each fit within a limit.
+
+    Args:
+        lines: Lines to group (a single line longer than the limit gets its
+            own chunk)
+        max_length: Maximum length of each chunk (e.g. an embed field)
+
+    Returns:
+        List of newline-joined chunks, in order
+    """
+    chunks = []
+    current: List[str] = []
+    length = 0
+    for line in lines:
+        if current and length + len(line) > max_length:
+            chunks.append("\n".join(current))
+            current, length = [], 0
+        current.append(line)
+        length += len(line) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
@@ -149,9 +149,11 @@ def sample_module(sample_concept, sample_concept_2):
         id="module-1",
         name="Network Analysis Fundamentals",
         description="Introduction to network analysis concepts",
-        content_url="",
+        content_urls=["https://example.com/network-analysis"],
         concepts=[sample_concept, sample_concept_2],
-        content="This module covers network centrality measures including degree, betweenness, and eigenvector centrality.",
+        contents={
+            "https://example.com/network-analysis": "This module covers network centrality measures including degree, betweenness, and eigenvector centrality.",
+        },
     )
 
 
@@ -164,7 +166,7 @@ def sample_module_2():
         id="module-2",
         name="Advanced Graph Algorithms",
         description="Advanced algorithms for graph analysis",
-        content_url="",
+        content_urls=["https://example.com/graph-algorithms"],
         concepts=[
             Concept(
                 id="concept-3",
@@ -175,7 +177,9 @@ def sample_module_2():
                 quiz_focus="Apply Dijkstra's and BFS algorithms",
             ),
         ],
-        content="This module covers shortest path algorithms.",
+        contents={
+            "https://example.com/graph-algorithms": "This module covers shortest path algorithms.",
+        },
     )
 
 
@@ -217,6 +217,292 @@ class TestAdminGradeReportScenarios:
         # CSV should contain module-specific data
         assert len(csv_content) > 0
 
+    @pytest.mark.asyncio
+    async def test_scenario_cached_reads_see_new_writes(
+        self,
+        configured_bot,
+        sample_module,
+    ):
+        """
+        Scenario: Cached student list and mastery reads reflect new activity
+
+        Given: The student list and a student's mastery have been read once
+        When: A new student registers and mastery is updated
+        Then: The next reads should include the changes
+        """
+        alice = await configured_bot.user_repo.get_or_create(
+            discord_id="111", username="alice"
+        )
+        assert len(await configured_bot.user_repo.get_all()) == 1
+        summary = await configured_bot.mastery_repo.get_summary(alice.id)
+        assert summary["mastered"] == 0
+        assert await configured_bot.mastery_repo.get_all_for_user(alice.id) == []
+
+        await configured_bot.user_repo.get_or_create(discord_id="222", username="bob")
+        await configured_bot.mastery_repo.update(
+            user_id=alice.id,
+            concept_id=sample_module.concepts[0].id,
+            total_attempts=3,
+            correct_attempts=3,
+            avg_quality_score=4.5,
+            mastery_level="mastered",
+        )
+
+        assert len(await configured_bot.user_repo.get_all()) == 2
+        summary = await configured_bot.mastery_repo.get_summary(alice.id)
+        assert summary["mastered"] == 1
+        records = await configured_bot.mastery_repo.get_all_for_user(alice.id)
+        assert [r.mastery_level for r in records] == ["mastered"]
+
+    @pytest.mark.asyncio
+    async def test_scenario_cached_users_are_copies(
+        self,
+        configured_bot,
+    ):
+        """
+        Scenario: A caller edits a user returned from the cached student list
+
+        Given: The student list has been read once
+        When: A caller changes a returned User
+        Then: The next read should still return the stored values
+        """
+        await configured_bot.user_repo.get_or_create(
+            discord_id="111", username="alice"
+        )
+        users = await configured_bot.user_repo.get_all()
+        users[0].username = "changed"
+
+        users = await configured_bot.user_repo.get_all()
+        assert users[0].username == "alice"
+
+    @pytest.mark.asyncio
+    async def test_scenario_registration_during_list_is_not_cached_stale(
+        self,
+        configured_bot,
+    ):
+        """
+        Scenario: A student registers while !students is reading the list
+
+        Given: A student list read is in flight
+        When: A new student is inserted before the read's rows are returned
+        Then: The pre-insert list should not be cached for later reads
+        """
+        repo = configured_bot.user_repo
+        await repo.get_or_create(discord_id="111", username="alice")
+        real_db = repo.db
+
+        class WriteAfterSelectCursor:
+            def __init__(self, cursor):
+                self._cursor = cursor
+
+            async def fetchall(self):
+                rows = await self._cursor.fetchall()
+                repo.db = real_db
+                await repo.get_or_create(discord_id="222", username="bob")
+                return rows
+
+        class WriteAfterSelectConnection:
+            async def execute(self, sql, params=()):
+                return WriteAfterSelectCursor(
+                    await real_db.connection.execute(sql, params)
+                )
+
+        repo.db = MagicMock(connection=WriteAfterSelectConnection())
+        assert len(await repo.get_all()) == 1
+
+        assert len(await repo.get_all()) == 2
+
+    @pytest.mark.asyncio
+    async def test_scenario_cached_mastery_records_are_copies(
+        self,
+        configured_bot,
+        sample_module,
+    ):
+        """
+        Scenario: A caller adjusts a mastery record returned from the cache
+
+        Given: A student's mastery records have been read once
+        When: A caller changes a returned record without saving it
+        Then: The next read should still return the stored values
+        """
+        alice = await configured_bot.user_repo.get_or_create(
+            discord_id="111", username="alice"
+        )
+        await configured_bot.mastery_repo.update(
+            user_id=alice.id,
+            concept_id=sample_module.concepts[0].id,
+            total_attempts=1,
+            correct_attempts=1,
+            avg_quality_score=4.0,
+            mastery_level="learning",
+        )
+        records = await configured_bot.mastery_repo.get_all_for_user(alice.id)
+        records[0].correct_attempts = 99
+
+        records = await configured_bot.mastery_repo.get_all_for_user(alice.id)
+        assert records[0].correct_attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_scenario_write_during_read_is_not_cached_stale(
+        self,
+        configured_bot,
+        sample_module,
+    ):
+        """
+        Scenario: A quiz answer is saved while /status is reading mastery
+
+        Given: A student's mastery read is in flight
+        When: A mastery write commits before the read's rows are returned
+        Then: The pre-write rows should not be cached for later reads
+        """
+        repo = configured_bot.mastery_repo
+        alice = await configured_bot.user_repo.get_or_create(
+            discord_id="111", username="alice"
+        )
+        real_db = repo.db
+
+        class WriteAfterSelectCursor:
+            def __init__(self, cursor):
+                self._cursor = cursor
+
+            async def fetchall(self):
+                rows = await self._cursor.fetchall()
+                repo.db = real_db
+                await repo.update(
+                    user_id=alice.id,
+                    concept_id=sample_module.concepts[0].id,
+                    total_attempts=1,
+                    correct_attempts=1,
+                    avg_quality_score=4.0,
+                    mastery_level="learning",
+                )
+                return rows
+
+        class WriteAfterSelectConnection:
+            async def execute(self, sql, params=()):
+                return WriteAfterSelectCursor(
+                    await real_db.connection.execute(sql, params)
+                )
+
+        repo.db = MagicMock(connection=WriteAfterSelectConnection())
+        assert await repo.get_all_for_user(alice.id) == []
+
+        records = await repo.get_all_for_user(alice.id)
+        assert [r.mastery_level for r in records] == ["learning"]
+
+    @pytest.mark.asyncio
+    async def test_scenario_mastery_version_tracks_quiz_answers(
+        self,
+        configured_bot,
+        sample_module,
+    ):
+        """
+        Scenario: Instructor checks !status right after a student answers
+
+        Given: A student's mastery version has been read for a cached embed
+        When: The student answers a quiz, without last_active changing
+        Then: The mastery version should change so the embed is rebuilt
+        """
+        alice = await configured_bot.user_repo.get_or_create(
+            discord_id="111", username="alice"
+        )
+        before = configured_bot.mastery_repo.get_version(alice.id)
+
+        await configured_bot.mastery_repo.update(
+            user_id=alice.id,
+            concept_id=sample_module.concepts[0].id,
+            total_attempts=1,
+            correct_attempts=1,
+            avg_quality_score=4.0,
+            mastery_level="learning",
+        )
+
+        assert configured_bot.mastery_repo.get_version(alice.id) != before
+
+    @pytest.mark.asyncio
+    async def test_scenario_grade_report_file_matches_text(
+        self,
+        configured_bot,
+        mock_user,
+        sample_module,
+    ):
+        """
+        Scenario: Grade report file holds the same CSV as the text report
+
+        Given: A student exists in the database
+        When: The grade report is generated as a file
+        Then: Its UTF-8 bytes should match the text report
+        """
+        await configured_bot.user_repo.get_or_create(
+            discord_id=str(mock_user.id),
+            username=mock_user.name,
+        )
+
+        csv_text = await configured_bot.grade_service.generate_grade_csv(sample_module)
+        csv_file = await configured_bot.grade_service.generate_grade_csv_file(sample_module)
+
+        assert csv_file.tell() == 0
+        assert csv_file.read().decode("utf-8") == csv_text
+
+    @pytest.mark.asyncio
+    async def test_scenario_grade_report_zip_round_trips(
+        self,
+        configured_bot,
+        mock_user,
+        sample_module,
+    ):
+        """
+        Scenario: Large grade reports are sent zipped
+
+        Given: A generated grade report file
+        When: It is compressed for upload
+        Then: The archive should hold the same CSV under the given name
+        """
+        import zipfile
+
+        await configured_bot.user_repo.get_or_create(
+            discord_id=str(mock_user.id),
+            username=mock_user.name,
+        )
+
+        csv_text = await configured_bot.grade_service.generate_grade_csv(sample_module)
+        csv_file = await configured_bot.grade_service.generate_grade_csv_file(sample_module)
+        zip_file = await configured_bot.grade_service.compress_grade_csv_file(
+            csv_file, "grades.csv"
+        )
+
+        assert zip_file.tell() == 0
+        with zipfile.ZipFile(zip_file) as archive:
+            assert archive.namelist() == ["grades.csv"]
+            assert archive.read("grades.csv").decode("utf-8") == csv_text
+
+    @pytest.mark.asyncio
+    async def test_scenario_grade_report_quotes_special_usernames(
+        self,
+        configured_bot,
+        sample_module,
+    ):
+        """
+        Scenario: Grade report stays valid CSV for unusual usernames
+
+        Given: A student whose username contains a comma and quotes
+        When: The grade report is generated
+        Then: A CSV reader should recover the username unchanged
+        """
+        import csv
+        import io
+
+        username = 'Smith, "Ace"'
+        await configured_bot.user_repo.get_or_create(
+            discord_id="333", username=username
+        )
+
+        csv_text = await configured_bot.grade_service.generate_grade_csv(sample_module)
+        rows = list(csv.reader(io.StringIO(csv_text)))
+
+        assert rows[0] == ["discord_id", "username", "module", "completion_pct"]
+        assert ["333", username, sample_module.id, "0.0"] in rows
+
 
 class TestAdminStudentStatusScenarios:
     """Test scenarios for viewing specific student status."""
@@ -641,3 +641,144 @@ class TestAgentErrorHandlingScenarios:
         # System should handle this gracefully
         fallback_intent = "assistant"
         assert fallback_intent == "assistant"
+
+
+class TestResponseCacheScenarios:
+    """Test scenarios for the semantic response cache."""
+
+    @pytest.fixture
+    def embedding_service(self):
+        """Create an embedding service that maps known questions to vectors."""
+        vectors = {
+            "what is betweenness centrality?": [1.0, 0.0, 0.0],
+            "what is betweenness centrality": [0.99, 0.05, 0.0],
+            "how does dijkstra's algorithm work?": [0.0, 1.0, 0.0],
+        }
+        service = MagicMock()
+        service.get_embedding = AsyncMock(
+            side_effect=lambda text: vectors.get(text, [0.0, 0.0, 1.0])
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_scenario_similar_question_hits_cache(self, embedding_service):
+        """
+        Scenario: A student asks a question another student already asked
+
+        Given: A cached reply for "What is betweenness centrality?"
+        When: A near-identical question is looked up
+        Then: The cached reply should be returned
+        """
+        from chibi.services.response_cache import ResponseCache
+
+        cache = ResponseCache(embedding_service, similarity_threshold=0.95)
+        question = "What is betweenness centrality?"
+        embedding = await cache.embed(question)
+        cache.store(question, embedding, "It counts shortest paths through a node.")
+
+        similar = "what is betweenness centrality"
+        result = cache.lookup(similar, await cache.embed(similar))
+
+        assert result == "It counts shortest paths through a node."
+
+    @pytest.mark.asyncio
+    async def test_scenario_different_question_misses_cache(self, embedding_service):
+        """
+        Scenario: A student asks an unrelated question
+
+        Given: A cached reply for a centrality question
+        When: A question about shortest paths is looked up
+        Then: No cached reply should be returned
+        """
+        from chibi.services.response_cache import ResponseCache
+
+        cache = ResponseCache(embedding_service, similarity_threshold=0.95)
+        question = "What is betweenness centrality?"
+        cache.store(question, await cache.embed(question), "Cached answer")
+
+        other = "How does Dijkstra's algorithm work?"
+        assert cache.lookup(other, await cache.embed(other)) is None
+
+    @pytest.mark.asyncio
+    async def test_scenario_cache_evicts_least_recently_used(self, embedding_service):
+        """
+        Scenario: The cache grows past its size limit
+
+        Given: A cache that holds a single entry
+        When: A second reply is stored
+        Then: The older entry should be evicted
+        """
+        from chibi.services.response_cache import ResponseCache
+
+        cache = ResponseCache(embedding_service, max_entries=1)
+        first = "What is betweenness centrality?"
+        second = "How does Dijkstra's algorithm work?"
+        cache.store(first, await cache.embed(first), "First")
+        cache.store(second, await cache.embed(second), "Second")
+
+        assert len(cache) == 1
+        assert cache.lookup(first, None) is None
+        assert cache.lookup(second, None) == "Second"
+
+    def test_scenario_short_followups_are_not_cacheable(self, embedding_service):
+        """
+        Scenario: A student sends a short follow-up like "yes"
+
+        Given: The response cache
+        When: A short, context-dependent message is checked
+        Then: It should not be eligible for caching
+        """
+        from chibi.services.response_cache import ResponseCache
+
+        cache = ResponseCache(embedding_service)
+
+        assert not cache.is_cacheable("yes")
+        assert not cache.is_cacheable("tell me more")
+        assert cache.is_cacheable("What is betweenness centrality?")
+
+    def test_scenario_followups_with_history_are_not_cacheable(self, embedding_service):
+        """
+        Scenario: A student asks a long follow-up mid-conversation
+
+        Given: The response cache
+        When: A long message is checked while the user has prior history
+        Then: It should not be eligible for caching, since the reply depends
+              on that student's conversation
+        """
+        from chibi.services.response_cache import ResponseCache
+
+        cache = ResponseCache(embedding_service)
+        followup = "Can you explain that in more detail please?"
+
+        assert cache.is_cacheable(followup)
+        assert not cache.is_cacheable(followup, has_history=True)
+
+    @pytest.mark.asyncio
+    async def test_scenario_reindexing_clears_cached_replies(self, embedding_service):
+        """
+        Scenario: Course content is re-indexed after an update
+
+        Given: A cached reply for a course question
+        When: A module is re-indexed
+        Then: The cached reply should be dropped
+        """
+        from chibi.content.course import Module
+        from chibi.services.content_indexer import ContentIndexer
+        from chibi.services.response_cache import ResponseCache
+
+        cache = ResponseCache(embedding_service)
+        question = "What is betweenness centrality?"
+        cache.store(question, await cache.embed(question), "Old answer")
+
+        rag_repo = MagicMock()
+        rag_repo.delete_source = AsyncMock()
+        indexer = ContentIndexer(
+            embedding_service=embedding_service,
+            rag_repo=rag_repo,
+            response_cache=cache,
+        )
+        await indexer.index_module(
+            Module(id="m1", name="Module 1"), force_reindex=True
+        )
+
+        assert len(cache) == 0
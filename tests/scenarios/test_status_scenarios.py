@@ -97,6 +97,48 @@ class TestStatusSummaryScenarios:
         assert summary.get("mastered", 0) == 0
         assert summary.get("novice", 0) == 0
 
+    @pytest.mark.asyncio
+    async def test_scenario_quiz_stats_counted_in_one_query(
+        self,
+        configured_bot,
+        sample_module,
+        mock_user,
+    ):
+        """
+        Scenario: Quiz statistics on the status embed
+
+        Given: A student who has answered some quizzes correctly
+        When: Their total and correct attempt counts are fetched together
+        Then: They should match the separate per-count queries
+        """
+        user = await configured_bot.user_repo.get_or_create(
+            discord_id=str(mock_user.id),
+            username=mock_user.name,
+        )
+
+        # No attempts yet
+        assert await configured_bot.quiz_repo.get_attempt_counts(user.id) == (0, 0)
+
+        concept = sample_module.concepts[0]
+        for is_correct in (True, False, True):
+            await configured_bot.quiz_repo.log_attempt(
+                user_id=user.id,
+                module_id=sample_module.id,
+                concept_id=concept.id,
+                quiz_format="free_form",
+                question="What is a graph?",
+                user_answer="An answer",
+                correct_answer=None,
+                is_correct=is_correct,
+            )
+
+        counts = await configured_bot.quiz_repo.get_attempt_counts(user.id)
+        assert counts == (3, 2)
+        assert counts == (
+            await configured_bot.quiz_repo.count_for_user(user.id),
+            await configured_bot.quiz_repo.count_correct_for_user(user.id),
+        )
+
 
 class TestModuleDetailScenarios:
     """Test scenarios for detailed module status view."""
@@ -190,6 +232,31 @@ class TestModuleListScenarios:
         assert any("Network Analysis" in name for name, _ in module_choices)
         assert any("Graph Algorithms" in name for name, _ in module_choices)
 
+    @pytest.mark.asyncio
+    async def test_scenario_module_autocomplete_is_case_insensitive(
+        self,
+        configured_bot,
+    ):
+        """
+        Scenario: Autocomplete a module name while typing
+
+        Given: A course with multiple modules
+        When: A user types part of a module name in any case
+        Then: Only the matching modules should be suggested
+        """
+        from chibi.cogs.utils import module_autocomplete_choices
+
+        choices = await module_autocomplete_choices(
+            configured_bot.course, "NETWORK"
+        )
+
+        assert len(choices) == 1
+        assert "Network Analysis" in choices[0].name
+
+        # Empty input suggests every module
+        choices = await module_autocomplete_choices(configured_bot.course, "")
+        assert len(choices) == 2
+
     @pytest.mark.asyncio
     async def test_scenario_get_module_concepts(
         self,